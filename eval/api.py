@@ -3,10 +3,23 @@
 from dotenv import load_dotenv
 load_dotenv()  # Load .env before importing worker
 
-from fastapi import FastAPI, HTTPException
-from typing import List
+from fastapi import FastAPI, Header, HTTPException, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 from datetime import datetime
-import uuid
+import asyncio
+import atexit
+import gzip
+import itertools
+import json
+import logging
+import logging.handlers
+import queue
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from eval.models import (
     EvaluationRequest, EvaluationResponse, EvaluationResults,
@@ -15,11 +28,113 @@ from eval.models import (
 from eval.job_queue import job_queue
 from eval.worker import start_evaluation_async
 
+logger = logging.getLogger(__name__)
+
+
+def _setup_logging() -> None:
+    """Route log records through a queue so worker threads never block on stdout.
+
+    Workers log per-job progress; a plain StreamHandler would serialize
+    them on the stream lock. QueueHandler hands records off to a single
+    listener thread that does the actual writing.
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    listener.start()
+    atexit.register(listener.stop)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+
+_setup_logging()
+
+class _GzipRequestMiddleware:
+    """ASGI middleware that transparently decompresses gzip request bodies.
+
+    Large question batches are highly repetitive JSON that compresses
+    5-10x; clients can send them with Content-Encoding: gzip and the
+    endpoints see plain JSON.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            headers = dict(scope["headers"])
+            if headers.get(b"content-encoding", b"").lower() == b"gzip":
+                body = b""
+                more_body = True
+                while more_body:
+                    message = await receive()
+                    body += message.get("body", b"")
+                    more_body = message.get("more_body", False)
+                body = gzip.decompress(body)
+
+                scope = dict(scope)
+                scope["headers"] = [
+                    (key, value) for key, value in scope["headers"]
+                    if key not in (b"content-encoding", b"content-length")
+                ] + [(b"content-length", str(len(body)).encode())]
+
+                consumed = False
+
+                async def replay_receive():
+                    nonlocal consumed
+                    if not consumed:
+                        consumed = True
+                        return {"type": "http.request", "body": body, "more_body": False}
+                    return await receive()
+
+                await self.app(scope, replay_receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class _SelectiveGZipMiddleware:
+    """Response gzip that skips streaming and long-poll paths.
+
+    GZipMiddleware compresses streaming responses unconditionally and
+    zlib buffers small writes, so SSE `data:` events would sit in the
+    compressor until the stream closes - the client would see no
+    progress until the job ends. Held long-poll responses are tiny and
+    latency-sensitive, so they skip compression too.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self._gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+
+    @staticmethod
+    def _exempt(path: str) -> bool:
+        if path.endswith("/events"):
+            return True
+        # /evaluate/{job_id} (the long-poll status endpoint), but not
+        # deeper paths like /evaluate/{job_id}/results
+        remainder = path.removeprefix("/evaluate/")
+        return remainder != path and "/" not in remainder
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self._exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        await self._gzip_app(scope, receive, send)
+
+
 app = FastAPI(
     title="SNA Evaluation Framework API",
     description="API for evaluating AI agent responses using PyRIT",
     version="1.0.0"
 )
+app.add_middleware(_GzipRequestMiddleware)
+# Compress responses for clients sending Accept-Encoding: gzip, except on
+# the SSE and long-poll endpoints where buffering breaks delivery
+app.add_middleware(_SelectiveGZipMiddleware, minimum_size=1024)
 
 
 @app.get("/")
@@ -28,51 +143,140 @@ async def root() -> dict:
     return {"status": "ok", "message": "SNA Evaluation Framework API"}
 
 
+# Cache the formatted health timestamp for 100ms so bursty liveness probes
+# don't pay datetime construction + ISO formatting on every request
+_HEALTH_TIMESTAMP_TTL = 0.1
+_health_cache: tuple = (0.0, "")
+
+
 @app.get("/health")
 async def health() -> dict:
     """Detailed health check."""
+    global _health_cache
+    cached_at, timestamp = _health_cache
+    now = time.monotonic()
+    if now - cached_at > _HEALTH_TIMESTAMP_TTL:
+        timestamp = datetime.utcnow().isoformat()
+        _health_cache = (now, timestamp)
     return {
         "status": "healthy",
         "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": timestamp
     }
 
 
+# Scorer catalogue is static - build the response objects once at import time
+# instead of re-validating six Pydantic models on every GET /scorers
+_SCORERS: List[ScorerInfo] = [
+    ScorerInfo(
+        name="numerical_accuracy",
+        weight=0.3,
+        description="Validates numerical precision and calculations"
+    ),
+    ScorerInfo(
+        name="data_methodology",
+        weight=0.3,
+        description="Evaluates data source transparency and methodology"
+    ),
+    ScorerInfo(
+        name="agent_routing",
+        weight=0.2,
+        description="Assesses correct agent selection and routing"
+    ),
+    ScorerInfo(
+        name="completeness",
+        weight=0.1,
+        description="Checks response completeness"
+    ),
+    ScorerInfo(
+        name="assumption_transparency",
+        weight=0.05,
+        description="Validates disclosure of assumptions and limitations"
+    ),
+    ScorerInfo(
+        name="error_handling",
+        weight=0.05,
+        description="Evaluates error handling and recovery"
+    )
+]
+
+
 @app.get("/scorers", response_model=List[ScorerInfo])
 async def list_scorers() -> List[ScorerInfo]:
     """List available scorers with their weights."""
-    return [
-        ScorerInfo(
-            name="numerical_accuracy",
-            weight=0.3,
-            description="Validates numerical precision and calculations"
-        ),
-        ScorerInfo(
-            name="data_methodology",
-            weight=0.3,
-            description="Evaluates data source transparency and methodology"
-        ),
-        ScorerInfo(
-            name="agent_routing",
-            weight=0.2,
-            description="Assesses correct agent selection and routing"
-        ),
-        ScorerInfo(
-            name="completeness",
-            weight=0.1,
-            description="Checks response completeness"
-        ),
-        ScorerInfo(
-            name="assumption_transparency",
-            weight=0.05,
-            description="Validates disclosure of assumptions and limitations"
-        ),
-        ScorerInfo(
-            name="error_handling",
-            weight=0.05,
-            description="Evaluates error handling and recovery"
-        )
-    ]
+    return _SCORERS
+
+
+# Submissions arriving within this window are created under one batched
+# queue insert instead of one lock acquisition each
+_SUBMIT_BATCH_WINDOW = 0.01  # seconds
+_SUBMIT_BATCH_MAX = 64
+
+_pending_submissions: asyncio.Queue = asyncio.Queue()
+
+# Process-wide monotonic suffix for job IDs: collision-free within the
+# process and cheaper than truncated random UUIDs
+_job_counter = itertools.count()
+
+
+def _new_job_id() -> str:
+    """Generate a unique job ID: eval_<UTC timestamp>_<random>_<counter>.
+
+    The counter restarts at zero with the process (uvicorn --reload
+    included) and the timestamp is second-granular, so the random
+    component is what keeps a restarted process from reissuing an
+    earlier id - which also names the on-disk pyrit_reports/<job_id>
+    directory a rerun would otherwise scavenge stale reports from.
+    """
+    return (
+        f"eval_{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}"
+        f"_{secrets.token_hex(3)}_{next(_job_counter):06x}"
+    )
+
+
+async def _submission_batcher() -> None:
+    """Drain bursts of pending submissions into batched job creation.
+
+    A failing batch fails its own futures and nothing else - the loop must
+    survive any exception, otherwise every later POST /evaluate would hang
+    on a future nobody resolves.
+    """
+    while True:
+        batch = [await _pending_submissions.get()]
+        await asyncio.sleep(_SUBMIT_BATCH_WINDOW)
+        while not _pending_submissions.empty() and len(batch) < _SUBMIT_BATCH_MAX:
+            batch.append(_pending_submissions.get_nowait())
+
+        try:
+            # create_jobs takes shard locks that workers also contend on, so
+            # run it in the threadpool - the event loop must never block on a
+            # threading.Lock (endpoint reads are already lock-free)
+            assigned = await asyncio.to_thread(
+                job_queue.create_jobs, [(job_id, request) for job_id, request, _ in batch]
+            )
+            for (job_id, _, created), assigned_job_id in zip(batch, assigned):
+                # A request deduplicated inside the batch window maps to an
+                # existing job; don't start a second evaluation for it
+                if assigned_job_id == job_id:
+                    start_evaluation_async(assigned_job_id)
+                if not created.done():
+                    created.set_result(assigned_job_id)
+        except Exception as exc:
+            logger.exception("Submission batch of %d request(s) failed", len(batch))
+            for _, _, created in batch:
+                if not created.done():
+                    created.set_exception(exc)
+
+
+# Strong reference to the batcher task - the event loop only keeps weak
+# references, so without this the task could be garbage collected
+_batcher_task: "asyncio.Task | None" = None
+
+
+@app.on_event("startup")
+async def _start_submission_batcher() -> None:
+    global _batcher_task
+    _batcher_task = asyncio.create_task(_submission_batcher())
 
 
 @app.post("/evaluate", response_model=EvaluationResponse, status_code=202)
@@ -91,27 +295,44 @@ async def submit_evaluation(request: EvaluationRequest) -> EvaluationResponse:
             if job:
                 logger.info(f"Duplicate request_id '{request.request_id}' detected - returning existing job {existing_job_id}")
                 return EvaluationResponse(
-                    job_id=job["job_id"],
-                    status=job["status"],
-                    submitted_at=job["submitted_at"],
-                    started_at=job.get("started_at"),
-                    completed_at=job.get("completed_at"),
-                    target_url=job["request"].target_url,
-                    total_questions=len(job["request"].questions),
-                    progress=ProgressInfo(**job["progress"]) if job.get("progress") else None,
+                    job_id=job.job_id,
+                    status=job.status,
+                    submitted_at=job.submitted_at,
+                    started_at=job.started_at,
+                    completed_at=job.completed_at,
+                    target_url=job.request.target_url,
+                    total_questions=job.total_questions,
+                    progress=job.progress,
                     message=f"Duplicate request_id detected. Returning existing job."
                 )
     
     # Generate job ID
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    job_id = f"eval_{timestamp}_{uuid.uuid4().hex[:6]}"
-    
-    # Create job in queue
-    job_queue.create_job(job_id, request)
-    
-    # Start background processing
-    start_evaluation_async(job_id)
-    
+    job_id = _new_job_id()
+
+    # Hand off to the batcher, which creates the job and starts processing.
+    # The future resolves to the job_id the request actually maps to.
+    created: asyncio.Future = asyncio.get_running_loop().create_future()
+    await _pending_submissions.put((job_id, request, created))
+    assigned_job_id = await created
+
+    if assigned_job_id != job_id:
+        # The same request_id landed earlier in the batch window (or raced
+        # past the pre-queue check above) - return the existing job
+        job = job_queue.get_job(assigned_job_id)
+        if job:
+            logger.info(f"Duplicate request_id '{request.request_id}' detected - returning existing job {assigned_job_id}")
+            return EvaluationResponse(
+                job_id=job.job_id,
+                status=job.status,
+                submitted_at=job.submitted_at,
+                started_at=job.started_at,
+                completed_at=job.completed_at,
+                target_url=job.request.target_url,
+                total_questions=job.total_questions,
+                progress=job.progress,
+                message=f"Duplicate request_id detected. Returning existing job."
+            )
+
     # Return immediate response
     return EvaluationResponse(
         job_id=job_id,
@@ -126,55 +347,163 @@ async def submit_evaluation(request: EvaluationRequest) -> EvaluationResponse:
     )
 
 
+# Upper bound on long-poll hold time so clients can't pin connections forever
+_MAX_LONG_POLL_SECONDS = 30
+
+# Dedicated pool for parked long-poll/SSE waiters. Each waiter blocks a
+# thread for up to the hold time, so routing them through the loop's
+# default executor (~32 threads) would let a few dozen pollers starve
+# everything else scheduled there - notably batched job creation, stalling
+# every POST /evaluate. These threads only ever sit in Event.wait, so a
+# generous cap is cheap.
+_WAIT_POOL = ThreadPoolExecutor(max_workers=256, thread_name_prefix="status-wait")
+atexit.register(_WAIT_POOL.shutdown, wait=False, cancel_futures=True)
+
+
+async def _wait_for_change(event: threading.Event, timeout: float) -> None:
+    """Wait on a job's change event without touching the default executor."""
+    await asyncio.get_running_loop().run_in_executor(_WAIT_POOL, event.wait, timeout)
+
+
+@app.get("/evaluate")
+async def get_evaluation_statuses(ids: str) -> dict:
+    """
+    Batch status lookup: GET /evaluate?ids=a,b,c
+
+    Returns {job_id: status} for every requested job in one response, so a
+    client polling M jobs pays one round-trip instead of M. Unknown IDs
+    map to null rather than failing the whole batch.
+    """
+    statuses = {}
+    for job_id in ids.split(","):
+        job = job_queue.get_job(job_id)
+        if job is None:
+            statuses[job_id] = None
+            continue
+        statuses[job_id] = {
+            "job_id": job.job_id,
+            "status": job.status.value,
+            "submitted_at": job.submitted_at.isoformat(),
+            "total_questions": job.total_questions,
+            "progress": (
+                job.progress.model_dump() if job.status == JobStatus.RUNNING else None
+            ),
+        }
+    return statuses
+
+
 @app.get("/evaluate/{job_id}", response_model=EvaluationResponse)
-async def get_evaluation_status(job_id: str) -> EvaluationResponse:
+async def get_evaluation_status(
+    job_id: str,
+    response: Response,
+    wait: int = 0,
+    if_none_match: Optional[str] = Header(None)
+) -> EvaluationResponse:
     """
     Get evaluation job status and results.
-    
+
     Poll this endpoint to check job progress and retrieve results when completed.
+    Pass ?wait=N (seconds, capped at 30) to long-poll: the request blocks until
+    the job's status or progress changes, or the timeout elapses.
+
+    Responses carry an ETag; pass it back via If-None-Match to get an empty
+    304 when the job hasn't changed since the previous poll.
     """
     job = job_queue.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
-    
-    # Build progress info if running
-    progress = None
-    if job["status"] == JobStatus.RUNNING:
-        progress = ProgressInfo(**job["progress"])
-    
+
+    if wait > 0 and job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+        # Grab the current event before waiting; workers replace it on change.
+        # Waiting happens on the dedicated pool so the event loop stays free.
+        event = job.change_event
+        await _wait_for_change(event, min(wait, _MAX_LONG_POLL_SECONDS))
+
+    # Cheap change fingerprint: status plus the monotonically increasing
+    # scorer counter. Unchanged polls cost a 304 with no body at all.
+    etag = f'"{job.status.value}-{job.progress.scorers_completed}"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # Return the job's own ProgressInfo instance if running - it is mutated
+    # in place by the worker, so no reconstruction is needed per poll
+    progress = job.progress if job.status == JobStatus.RUNNING else None
+
     return EvaluationResponse(
         job_id=job_id,
-        status=job["status"],
-        submitted_at=job["submitted_at"],
-        started_at=job.get("started_at"),
-        completed_at=job.get("completed_at"),
-        target_url=job["request"].target_url,
-        total_questions=len(job["request"].questions),
+        status=job.status,
+        submitted_at=job.submitted_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        target_url=job.request.target_url,
+        total_questions=job.total_questions,
         progress=progress
     )
 
 
+# How long the SSE generator waits on the change event before re-checking
+# the job; bounds how long a stream lingers after a client disconnects
+_SSE_HEARTBEAT_SECONDS = 15
+
+
+@app.get("/evaluate/{job_id}/events")
+async def stream_evaluation_events(job_id: str) -> StreamingResponse:
+    """
+    Stream job status changes as Server-Sent Events.
+
+    Emits a `data:` event with the current status (and progress while
+    running) whenever the job changes, and closes the stream once the job
+    reaches a terminal state. Clients get push updates over one held
+    connection instead of polling.
+    """
+    job = job_queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    async def event_stream():
+        while True:
+            # Grab the event before snapshotting, so a change that lands
+            # between snapshot and wait still wakes us immediately
+            event = job.change_event
+            payload = {
+                "job_id": job.job_id,
+                "status": job.status.value,
+                "progress": (
+                    job.progress.model_dump() if job.status == JobStatus.RUNNING else None
+                ),
+            }
+            yield f"data: {json.dumps(payload)}\n\n"
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                return
+            await _wait_for_change(event, _SSE_HEARTBEAT_SECONDS)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.get("/evaluate/{job_id}/results", response_model=EvaluationResults)
-async def get_evaluation_results(job_id: str) -> EvaluationResults:
+async def get_evaluation_results(job_id: str) -> Response:
     """
     Get detailed evaluation results.
-    
+
     Only available when job status is 'completed'.
     """
     job = job_queue.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
-    
-    if job["status"] != JobStatus.COMPLETED:
+
+    if job.status != JobStatus.COMPLETED:
         raise HTTPException(
-            status_code=400, 
-            detail=f"Results not available. Job status: {job['status']}"
+            status_code=400,
+            detail=f"Results not available. Job status: {job.status}"
         )
-    
-    if not job.get("results"):
+
+    if not job.results_json:
         raise HTTPException(status_code=500, detail="Results not found in job data")
-    
-    return job["results"]
+
+    # Results were serialized once at completion; return the prebuilt bytes
+    # and skip Pydantic response validation on this hot polling endpoint
+    return Response(content=job.results_json, media_type="application/json")
 
 
 @app.get("/jobs")
@@ -185,10 +514,10 @@ async def list_jobs() -> dict:
         "total": len(jobs),
         "jobs": [
             {
-                "job_id": job["job_id"],
-                "status": job["status"],
-                "submitted_at": job["submitted_at"].isoformat(),
-                "total_questions": len(job["request"].questions)
+                "job_id": job.job_id,
+                "status": job.status,
+                "submitted_at": job.submitted_at.isoformat(),
+                "total_questions": job.total_questions
             }
             for job in jobs
         ]
@@ -33,7 +33,15 @@ Security: The hydrated file (e.g. eval/datasets_sensitive/in_scope_questions_hyd
 import sys
 import re
 import yaml
+import asyncio
 import argparse
+import functools
+
+try:
+    # libyaml C loader: ~10x faster than the pure-Python loader, same API
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from pathlib import Path
 from typing import Dict, Optional
 import logging
@@ -48,31 +56,77 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Escape table for double-quoted YAML scalars; translate() walks the string
+# once in C and, unlike the old chained .replace, escapes backslashes too
+_YAML_ESCAPE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+# How many hydration queries may be in flight at once
+_QUERY_CONCURRENCY = 8
+
+# ASCII record separator used to join outcomes for batch hydration;
+# never appears in template text
+_OUTCOME_SEP = '\x1e'
+
+# Formatter dispatch table - one hash lookup instead of an if/elif chain
+_FORMATTERS = {
+    'currency': lambda v: f"€{v:,.2f}",       # €1,234,567.89
+    'percentage': lambda v: f"{v:.1f}%",       # 45.3%
+    'units': lambda v: f"{int(v):,} units",    # 1,234 units
+    'number': lambda v: f"{int(v):,}",         # 1,234,567
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_value(value: str, format_type: str) -> str:
+    """Format a raw value; pure function, memoized on (value, format_type).
+
+    Repeated placeholders referencing the same column skip the float parse
+    and re-formatting entirely.
+    """
+    formatter = _FORMATTERS.get(format_type)
+    if formatter is None:
+        logger.warning(f"Unknown format type: {format_type}")
+        return value
+
+    try:
+        num_value = float(value.replace(',', ''))
+        return formatter(num_value)
+    except Exception as e:
+        logger.warning(f"Failed to format value '{value}' as {format_type}: {e}")
+        return value
+
+
 class TestDataHydrator:
     """Hydrates template evaluation files with real data from your database."""
-    
-    PLACEHOLDER_PATTERN = r'\{\{(\w+)\|(\w+)\}\}'
-    
+
+    PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\|(\w+)\}\}')
+
     def __init__(self, template_file: str, output_file: Optional[str] = None):
         """
         Initialize hydrator.
-        
+
         Args:
             template_file: Path to template YAML with {{PLACEHOLDER}} syntax
             output_file: Path to write hydrated YAML (optional for dry-run)
         """
         self.template_file = Path(template_file)
         self.output_file = Path(output_file) if output_file else None
+        # Per-outcome hydration plans: outcome string -> list of literal
+        # fragments and (column, format) placeholder tuples. Re-hydrating
+        # the same template text never touches the regex twice.
+        self._plan_cache: Dict[str, list] = {}
     
-    def execute_query(self, sql: str) -> Optional[Dict[str, str]]:
+    async def execute_query(self, sql: str) -> Optional[Dict[str, str]]:
         """
         Execute SQL query and return results as dict.
-        
-        TODO: Implement your database connection here.
-        
+
+        TODO: Implement your database connection here - use an async driver
+              (e.g. asyncpg / aiomysql) acquired from a shared connection
+              pool so concurrent queries actually overlap.
+
         Args:
             sql: SQL query to execute
-            
+
         Returns:
             Dict with column names as keys, values as strings
         """
@@ -109,94 +163,154 @@ class TestDataHydrator:
     def format_value(self, value: str, format_type: str) -> str:
         """
         Format value according to format type.
-        
+
         Args:
             value: Raw value from database
             format_type: One of: currency, percentage, units, number
-            
+
         Returns:
             Formatted string
         """
-        try:
-            num_value = float(value.replace(',', ''))
-            
-            if format_type == 'currency':
-                # Format as currency with thousands separator
-                return f"€{num_value:,.2f}"
-            elif format_type == 'percentage':
-                # Format as percentage with 1 decimal
-                return f"{num_value:.1f}%"
-            elif format_type == 'units':
-                # Format with thousands separator + " units"
-                return f"{int(num_value):,} units"
-            elif format_type == 'number':
-                # Format with thousands separator
-                return f"{int(num_value):,}"
-            else:
-                logger.warning(f"Unknown format type: {format_type}")
-                return value
-        except Exception as e:
-            logger.warning(f"Failed to format value '{value}' as {format_type}: {e}")
-            return value
+        return _format_value(value, format_type)
     
+    def _build_plan(self, outcome: str) -> list:
+        """
+        Split an outcome string into a hydration plan.
+
+        The plan is a list of literal string fragments interleaved with
+        (column_name, format_type) tuples for each placeholder, so repeated
+        hydration of the same template skips the regex scan entirely.
+        """
+        plan = []
+        pos = 0
+        for match in self.PLACEHOLDER_PATTERN.finditer(outcome):
+            if match.start() > pos:
+                plan.append(outcome[pos:match.start()])
+            plan.append((match.group(1), match.group(2)))
+            pos = match.end()
+        if pos < len(outcome):
+            plan.append(outcome[pos:])
+        return plan
+
     def hydrate_expected_outcome(self, outcome: str, query_result: Dict[str, str]) -> str:
         """
         Replace placeholders in expected_outcome with real values.
-        
+
         Args:
             outcome: Expected outcome string with {{PLACEHOLDER}} syntax
             query_result: Dict with column values from SQL query
-            
+
         Returns:
             Hydrated expected_outcome string
         """
+        plan = self._plan_cache.get(outcome)
+        if plan is None:
+            plan = self._plan_cache[outcome] = self._build_plan(outcome)
+
+        parts = []
+        for part in plan:
+            if isinstance(part, str):
+                parts.append(part)
+                continue
+            column_name, format_type = part
+            if column_name in query_result:
+                parts.append(self.format_value(query_result[column_name], format_type))
+            else:
+                logger.warning(f"Column '{column_name}' not found in query result. Available: {list(query_result.keys())}")
+                parts.append(f'{{{{{column_name}|{format_type}}}}}')  # Keep placeholder if not found
+        return ''.join(parts)
+
+    def hydrate_expected_outcomes(self, outcomes: list, query_result: Dict[str, str]) -> list:
+        """
+        Hydrate several outcome strings that share one query result.
+
+        Joins the outcomes with a record separator and runs a single regex
+        pass, entering the matcher once per group instead of once per row.
+
+        Args:
+            outcomes: Expected outcome strings with {{PLACEHOLDER}} syntax
+            query_result: Dict with column values from SQL query
+
+        Returns:
+            Hydrated outcome strings, in input order
+        """
         def replace_placeholder(match):
             column_name = match.group(1)
             format_type = match.group(2)
-            
             if column_name in query_result:
-                raw_value = query_result[column_name]
-                return self.format_value(raw_value, format_type)
-            else:
-                logger.warning(f"Column '{column_name}' not found in query result. Available: {list(query_result.keys())}")
-                return match.group(0)  # Keep placeholder if not found
-        
-        return re.sub(self.PLACEHOLDER_PATTERN, replace_placeholder, outcome)
+                return self.format_value(query_result[column_name], format_type)
+            logger.warning(f"Column '{column_name}' not found in query result. Available: {list(query_result.keys())}")
+            return match.group(0)  # Keep placeholder if not found
+
+        joined = _OUTCOME_SEP.join(outcomes)
+        return self.PLACEHOLDER_PATTERN.sub(replace_placeholder, joined).split(_OUTCOME_SEP)
     
-    def hydrate_file(self, dry_run: bool = False) -> int:
+    async def hydrate_file(self, dry_run: bool = False) -> int:
         """
         Hydrate template file with real data.
-        
+
         Args:
             dry_run: If True, print hydrated values without writing file
-            
+
         Returns:
             Number of test cases hydrated
         """
         logger.info(f"Loading template: {self.template_file}")
-        
-        # Load template YAML
+
+        # Parse YAML straight from the file object - no full-file string copy
         with open(self.template_file, 'r') as f:
-            template_content = f.read()
-        
-        # Parse YAML
-        tests = yaml.safe_load(template_content)
-        
+            tests = yaml.load(f, Loader=_YamlLoader)
+
         if not isinstance(tests, list):
             logger.error("Template file must contain a list of test cases")
             return 0
-        
+
+        # First pass: find tests that actually need a query
+        pending = []  # (test index, sql)
+        for idx, test in enumerate(tests):
+            expected_outcome = test.get('expected_outcome', '')
+            sql_query = test.get('sql_query') or ''
+            sql_query = sql_query.strip() if sql_query else ''
+            if sql_query and '{{' in expected_outcome:
+                pending.append((idx, sql_query))
+
+        # Dispatch queries concurrently (bounded) so the DB round-trips
+        # overlap; identical SQL is deduplicated and runs only once
+        semaphore = asyncio.Semaphore(_QUERY_CONCURRENCY)
+
+        async def run_query(sql: str) -> Optional[Dict[str, str]]:
+            async with semaphore:
+                return await self.execute_query(sql)
+
+        unique_sqls = list(dict.fromkeys(sql for _, sql in pending))
+        query_results = await asyncio.gather(*(run_query(sql) for sql in unique_sqls))
+        results_by_sql = dict(zip(unique_sqls, query_results))
+        results_by_index = {idx: results_by_sql[sql] for idx, sql in pending}
+
+        # Batch-hydrate each query group: all outcomes sharing one result
+        # go through a single regex pass
+        groups: Dict[str, list] = {}
+        for idx, sql in pending:
+            groups.setdefault(sql, []).append(idx)
+
+        hydrated_by_index: Dict[int, str] = {}
+        for sql, indices in groups.items():
+            result = results_by_sql[sql]
+            if not result:
+                continue
+            outcomes = [tests[idx].get('expected_outcome', '') for idx in indices]
+            for idx, hydrated in zip(indices, self.hydrate_expected_outcomes(outcomes, result)):
+                hydrated_by_index[idx] = hydrated
+
         hydrated_count = 0
         hydrated_tests = []
-        
+
         for i, test in enumerate(tests, 1):
             question = test.get('question', '')
             expected_outcome = test.get('expected_outcome', '')
-            sql_query = test.get('sql_query') or ''
-            sql_query = sql_query.strip() if sql_query else ''
-            
+
             # Skip tests without SQL queries or placeholders
-            if not sql_query or '{{' not in expected_outcome:
+            if i - 1 not in results_by_index:
                 logger.info(f"[{i}/{len(tests)}] SKIPPED: {question[:50]}... (no placeholders or SQL)")
                 # Preserve only question and expected_outcome
                 hydrated_test = {
@@ -205,16 +319,12 @@ class TestDataHydrator:
                 }
                 hydrated_tests.append(hydrated_test)
                 continue
-            
+
             logger.info(f"[{i}/{len(tests)}] Processing: {question[:60]}...")
-            
-            # Execute query
-            result = self.execute_query(sql_query)
-            
-            if result:
-                # Hydrate placeholders
-                hydrated_outcome = self.hydrate_expected_outcome(expected_outcome, result)
-                
+
+            if (i - 1) in hydrated_by_index:
+                hydrated_outcome = hydrated_by_index[i - 1]
+
                 if dry_run:
                     logger.info(f"  {expected_outcome[:80]} → {hydrated_outcome[:80]}")
                 
@@ -235,16 +345,15 @@ class TestDataHydrator:
         
         # Write hydrated file (unless dry-run)
         if not dry_run and self.output_file:
-            self._write_hydrated_yaml(template_content, hydrated_tests)
-        
+            self._write_hydrated_yaml(hydrated_tests)
+
         return hydrated_count
-    
-    def _write_hydrated_yaml(self, original_content: str, hydrated_tests: list):
+
+    def _write_hydrated_yaml(self, hydrated_tests: list):
         """
         Write hydrated YAML file with only question and expected_outcome fields.
-        
+
         Args:
-            original_content: Original template file content
             hydrated_tests: List of hydrated test dicts
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -270,21 +379,20 @@ class TestDataHydrator:
 
 """
         
-        # Write file with custom formatting
+        # Build the whole file in memory and write it with a single call
+        # instead of several small writes per test case
+        parts = [header]
+        for test in hydrated_tests:
+            question = test['question'].translate(_YAML_ESCAPE)
+            expected_outcome = test['expected_outcome'].translate(_YAML_ESCAPE)
+            parts.append(f'- question: "{question}"\n  expected_outcome: "{expected_outcome}"\n\n')
+
+        # Blank line between elements, but not after the last one
+        if len(parts) > 1:
+            parts[-1] = parts[-1][:-1]
+
         with open(self.output_file, 'w') as f:
-            f.write(header)
-            
-            for i, test in enumerate(hydrated_tests):
-                # Write each test with proper formatting
-                question = test['question'].replace('"', '\\"')
-                expected_outcome = test['expected_outcome'].replace('"', '\\"')
-                
-                f.write(f'- question: "{question}"\n')
-                f.write(f'  expected_outcome: "{expected_outcome}"\n')
-                
-                # Add blank line between elements (except after last one)
-                if i < len(hydrated_tests) - 1:
-                    f.write("\n")
+            f.write(''.join(parts))
         
         logger.info(f"✅ Hydrated file written: {self.output_file}")
 
@@ -356,7 +464,7 @@ Examples:
             output_file=args.output
         )
         
-        hydrated_count = hydrator.hydrate_file(dry_run=args.dry_run)
+        hydrated_count = asyncio.run(hydrator.hydrate_file(dry_run=args.dry_run))
         
         if args.dry_run:
             logger.info(f"\n🔍 DRY RUN COMPLETE: {hydrated_count} test cases would be hydrated")
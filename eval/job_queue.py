@@ -1,95 +1,216 @@
 """In-memory job queue for managing evaluation jobs."""
 
 import threading
-from typing import Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from datetime import datetime
 from eval.models import JobStatus, EvaluationRequest, EvaluationResults, ProgressInfo
 
 
+@dataclass(slots=True)
+class Job:
+    """Record for a single evaluation job."""
+    job_id: str
+    status: JobStatus
+    request: EvaluationRequest
+    submitted_at: datetime
+    # Single mutable ProgressInfo, updated in place and returned directly
+    # by the status endpoint - no per-poll re-validation
+    progress: ProgressInfo
+    # Cached len(request.questions) so status polls and job listings don't
+    # walk the Pydantic attribute chain per read
+    total_questions: int = 0
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    results: Optional[EvaluationResults] = None
+    # Results serialized once at completion so the polling endpoint can
+    # return prebuilt bytes instead of re-validating the model per GET
+    results_json: Optional[bytes] = None
+    error: Optional[str] = None
+    request_id: Optional[str] = None
+    # Guards compound progress writes without touching the shard lock;
+    # readers snapshot the plain int counters unlocked (GIL-safe)
+    progress_lock: threading.Lock = field(default_factory=threading.Lock)
+    # Signalled (and replaced) whenever status or progress changes, so
+    # long-poll waiters wake immediately instead of re-polling
+    change_event: threading.Event = field(default_factory=threading.Event)
+
+    def notify_change(self) -> None:
+        """Wake anyone long-polling this job and arm a fresh event."""
+        event = self.change_event
+        self.change_event = threading.Event()
+        event.set()
+
+
+# Number of lock shards; must be a power of two so we can mask instead of modulo
+_SHARD_COUNT = 16
+
+# Upper bound on the request_id -> job_id dedup map; oldest entries are
+# evicted first so memory stays flat on long-lived deployments
+_MAX_REQUEST_IDS = 100_000
+
+
 class JobQueue:
-    """Thread-safe in-memory job queue."""
-    
+    """Thread-safe in-memory job queue.
+
+    Jobs are sharded by job_id hash so writers on different shards don't
+    contend on a single global lock. Single-key dict reads are atomic under
+    the GIL, so lookups skip locking entirely.
+    """
+
     def __init__(self):
-        self._jobs: Dict[str, Dict] = {}
-        self._request_ids: Dict[str, str] = {}  # Maps request_id -> job_id
-        self._lock = threading.Lock()
-    
+        self._shards: List[Dict[str, Job]] = [{} for _ in range(_SHARD_COUNT)]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(_SHARD_COUNT)]
+        # Maps request_id -> job_id, bounded, oldest-first eviction
+        self._request_ids: "OrderedDict[str, str]" = OrderedDict()
+        self._request_ids_lock = threading.Lock()
+
+    @staticmethod
+    def _shard_of(job_id: str) -> int:
+        return hash(job_id) & (_SHARD_COUNT - 1)
+
     def find_by_request_id(self, request_id: str) -> Optional[str]:
         """Find existing job_id by request_id."""
-        with self._lock:
-            return self._request_ids.get(request_id)
-    
-    def create_job(self, job_id: str, request: EvaluationRequest) -> None:
-        """Create a new job."""
-        with self._lock:
-            # Track request_id if provided
+        # Lock-free read: single-key dict get is atomic under the GIL
+        return self._request_ids.get(request_id)
+
+    @staticmethod
+    def _new_job(job_id: str, request: EvaluationRequest) -> Job:
+        total_questions = len(request.questions)
+        return Job(
+            job_id=job_id,
+            status=JobStatus.QUEUED,
+            request=request,
+            submitted_at=datetime.utcnow(),
+            progress=ProgressInfo(
+                questions_total=total_questions,
+                scorers_total=total_questions * 6,  # 6 scorers per question
+            ),
+            total_questions=total_questions,
+            request_id=request.request_id,
+        )
+
+    def _register_request_id(self, request_id: str, job_id: str) -> None:
+        with self._request_ids_lock:
+            self._request_ids[request_id] = job_id
+            self._request_ids.move_to_end(request_id)
+            if len(self._request_ids) > _MAX_REQUEST_IDS:
+                self._request_ids.popitem(last=False)
+
+    def create_job(self, job_id: str, request: EvaluationRequest) -> str:
+        """Create a new job. Returns the job_id the request maps to."""
+        return self.create_jobs([(job_id, request)])[0]
+
+    def create_jobs(self, items: List[tuple]) -> List[str]:
+        """Create a batch of jobs, amortizing lock acquisition per shard.
+
+        Args:
+            items: List of (job_id, request) pairs
+
+        Returns:
+            The job_id each request actually maps to, in input order: a
+            request whose request_id is already registered (including
+            earlier in the same batch) keeps the existing job instead of
+            creating a duplicate.
+        """
+        assigned: List[str] = []
+        seen_in_batch: Dict[str, str] = {}
+        to_create: List[tuple] = []
+        for job_id, request in items:
+            request_id = request.request_id
+            if request_id:
+                existing = seen_in_batch.get(request_id) or self._request_ids.get(request_id)
+                if existing is not None:
+                    assigned.append(existing)
+                    continue
+                seen_in_batch[request_id] = job_id
+            to_create.append((job_id, request))
+            assigned.append(job_id)
+
+        by_shard: Dict[int, List[tuple]] = {}
+        for job_id, request in to_create:
+            by_shard.setdefault(self._shard_of(job_id), []).append((job_id, request))
+
+        for idx, group in by_shard.items():
+            with self._locks[idx]:
+                shard = self._shards[idx]
+                for job_id, request in group:
+                    shard[job_id] = self._new_job(job_id, request)
+
+        # Publish request_ids only after the jobs are visible in their
+        # shards, so find_by_request_id can never hand out a job_id that
+        # a subsequent get_job would still miss
+        for job_id, request in to_create:
             if request.request_id:
-                self._request_ids[request.request_id] = job_id
-            
-            self._jobs[job_id] = {
-                "job_id": job_id,
-                "status": JobStatus.QUEUED,
-                "request": request,
-                "submitted_at": datetime.utcnow(),
-                "started_at": None,
-                "completed_at": None,
-                "results": None,
-                "error": None,
-                "progress": {
-                    "questions_completed": 0,
-                    "questions_total": len(request.questions),
-                    "scorers_completed": 0,
-                    "scorers_total": len(request.questions) * 6,  # 6 scorers per question
-                    "percent": 0
-                },
-                "request_id": request.request_id
-            }
-    
-    def get_job(self, job_id: str) -> Optional[Dict]:
+                self._register_request_id(request.request_id, job_id)
+
+        return assigned
+
+    def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID."""
-        with self._lock:
-            return self._jobs.get(job_id)
-    
+        # Lock-free read against the owning shard
+        return self._shards[self._shard_of(job_id)].get(job_id)
+
     def update_status(self, job_id: str, status: JobStatus) -> None:
         """Update job status."""
-        with self._lock:
-            if job_id in self._jobs:
-                self._jobs[job_id]["status"] = status
-                if status == JobStatus.RUNNING and not self._jobs[job_id]["started_at"]:
-                    self._jobs[job_id]["started_at"] = datetime.utcnow()
+        idx = self._shard_of(job_id)
+        with self._locks[idx]:
+            job = self._shards[idx].get(job_id)
+            if job:
+                job.status = status
+                if status == JobStatus.RUNNING and not job.started_at:
+                    job.started_at = datetime.utcnow()
                 elif status in [JobStatus.COMPLETED, JobStatus.FAILED]:
-                    self._jobs[job_id]["completed_at"] = datetime.utcnow()
-    
+                    job.completed_at = datetime.utcnow()
+                job.notify_change()
+
     def update_progress(self, job_id: str, questions_completed: int, scorers_completed: int) -> None:
         """Update job progress."""
-        with self._lock:
-            if job_id in self._jobs:
-                job = self._jobs[job_id]
-                job["progress"]["questions_completed"] = questions_completed
-                job["progress"]["scorers_completed"] = scorers_completed
-                
-                # Calculate percentage
-                total_scorers = job["progress"]["scorers_total"]
-                if total_scorers > 0:
-                    job["progress"]["percent"] = int((scorers_completed / total_scorers) * 100)
-    
+        job = self.get_job(job_id)
+        if job is None:
+            return
+        # Per-job lock: concurrent scorer completions on one job serialize
+        # here without contending with creates/polls on the shard
+        with job.progress_lock:
+            job.progress.questions_completed = questions_completed
+            job.progress.scorers_completed = scorers_completed
+
+            # Calculate percentage in pure integer math - no float allocation
+            total_scorers = job.progress.scorers_total
+            if total_scorers > 0:
+                job.progress.percent = (scorers_completed * 100) // total_scorers
+        job.notify_change()
+
     def set_results(self, job_id: str, results: EvaluationResults) -> None:
         """Set job results."""
-        with self._lock:
-            if job_id in self._jobs:
-                self._jobs[job_id]["results"] = results
-    
+        idx = self._shard_of(job_id)
+        with self._locks[idx]:
+            job = self._shards[idx].get(job_id)
+            if job:
+                job.results = results
+                # Serialize once - results are immutable after completion
+                job.results_json = results.model_dump_json().encode()
+                job.notify_change()
+
     def set_error(self, job_id: str, error: str) -> None:
         """Set job error."""
-        with self._lock:
-            if job_id in self._jobs:
-                self._jobs[job_id]["error"] = error
-                self._jobs[job_id]["status"] = JobStatus.FAILED
-    
-    def list_jobs(self) -> list:
+        idx = self._shard_of(job_id)
+        with self._locks[idx]:
+            job = self._shards[idx].get(job_id)
+            if job:
+                job.error = error
+                job.status = JobStatus.FAILED
+                job.notify_change()
+
+    def list_jobs(self) -> List[Job]:
         """List all jobs."""
-        with self._lock:
-            return list(self._jobs.values())
+        jobs: List[Job] = []
+        for shard in self._shards:
+            # Snapshot each shard without locking; list() over a dict is
+            # atomic enough for a monitoring endpoint
+            jobs.extend(shard.values())
+        return jobs
 
 
 # Global job queue instance
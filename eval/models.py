@@ -1,7 +1,7 @@
 """Pydantic models for API request/response validation."""
 
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator
 from datetime import datetime
 from enum import Enum
 
@@ -30,11 +30,58 @@ class Question(BaseModel):
 class EvaluationRequest(BaseModel):
     """Request model for batch evaluation."""
     target_url: str = Field(..., description="Target endpoint URL to evaluate")
-    questions: List[Question] = Field(..., min_items=1, description="List of questions to evaluate")
+    questions: List[Question] = Field(..., min_length=1, description="List of questions to evaluate")
     request_id: Optional[str] = Field(None, description="Optional unique request ID to prevent duplicate evaluations")
 
-    class Config:
-        json_schema_extra = {
+    @model_validator(mode="before")
+    @classmethod
+    def _expand_columnar_questions(cls, data):
+        """Accept `questions` in columnar (struct-of-arrays) form.
+
+        Clients may send {"question": [...], "response": [...],
+        "agent": [...], "reason": [...]} instead of a list of nested
+        dicts - the repeated key names then appear once on the wire
+        instead of once per question. Expanded here to the row form the
+        rest of the pipeline expects.
+        """
+        if isinstance(data, dict) and isinstance(data.get("questions"), dict):
+            columns = data["questions"]
+            missing = [key for key in ("question", "response", "agent", "reason") if key not in columns]
+            if missing:
+                raise ValueError(f"columnar questions payload is missing columns: {', '.join(missing)}")
+            # Strings are zippable character by character, so a scalar here
+            # would silently fabricate one-character "questions"
+            not_lists = [
+                key for key in ("question", "response", "agent", "reason")
+                if not isinstance(columns[key], list)
+            ]
+            if not_lists:
+                raise ValueError(f"columnar questions payload columns must be lists: {', '.join(not_lists)}")
+            data = dict(data)
+            try:
+                data["questions"] = [
+                    {
+                        "question": question,
+                        "expected_outcome": {
+                            "response": response,
+                            "agent": agent,
+                            "reason": reason,
+                        },
+                    }
+                    for question, response, agent, reason in zip(
+                        columns["question"],
+                        columns["response"],
+                        columns["agent"],
+                        columns["reason"],
+                        strict=True,
+                    )
+                ]
+            except ValueError:
+                raise ValueError("columnar questions payload has columns of unequal length")
+        return data
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "target_url": "http://localhost:6000/chat",
                 "questions": [
@@ -49,6 +96,7 @@ class EvaluationRequest(BaseModel):
                 ]
             }
         }
+    )
 
 
 class ProgressInfo(BaseModel):
@@ -8,14 +8,45 @@ Fast, deterministic, and zero API cost.
 from pyrit.score import Scorer, ScorerPromptValidator
 from pyrit.models.score import Score
 from pyrit.models.message_piece import MessagePiece
+import functools
 import re
 import json
 import logging
 from typing import Optional
 
+try:
+    import orjson  # faster JSON decode for the per-score expected_output parse
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data):
+    """Decode JSON via orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_expected(expected_str: str) -> dict:
+    """Parse an expected_output JSON string, memoized.
+
+    The same string is handed to every scorer (and every retry) of a
+    question, so caching collapses N_scorers x N_retries parses to one per
+    distinct question. Callers must not mutate the returned dict.
+    """
+    return _json_loads(expected_str)
+
+# Compiled once at import - the scorer runs per message piece, so per-call
+# re.search pattern-cache lookups add up. The pattern is anchored: a cheap
+# str.find locates the literal key, then match() runs from that offset, so
+# the regex engine never scans the (potentially large) response body.
+_AGENT_USED_KEY = "'AgentUsed':"
+_AGENT_USED_RE = re.compile(r"'AgentUsed':[ \t]*'([A-Za-z0-9_]+)'")
+
+
 class AgentRoutingScorer(Scorer):
     """
     Programmatic scorer that validates agent routing decisions.
@@ -76,36 +107,42 @@ class AgentRoutingScorer(Scorer):
             # If already a dict, use directly
             if isinstance(expected_output, dict):
                 expected_data = expected_output
-            # If a string, parse as JSON
+            # If a string, parse as JSON (cached - strings are hashable)
             elif isinstance(expected_output, str):
-                expected_data = json.loads(expected_output)
+                expected_data = _parse_expected(expected_output)
             else:
                 expected_data = {}
-            
+
             expected_agent = expected_data.get('agent')
-        except (json.JSONDecodeError, TypeError, AttributeError) as e:
+        except (ValueError, TypeError, AttributeError) as e:
             raise ValueError(f"Failed to parse expected_output: {e}")
         
-        # Get actual outcome from message_piece.converted_value (API response)
-        response_text = str(message_piece.converted_value)
-        
-        # Try to extract agent from response (format: "AgentUsed': 'agent_name")
-        agent_match = re.search(r"'AgentUsed':\s*'(\w+)'", response_text)
-        actual_agent = agent_match.group(1) if agent_match else None
-        
-        # Validate
+        # Validate. The no-expected-agent case is checked first: it scores
+        # 0.0 regardless of the response, so the response scan is skipped
+        # entirely on datasets that omit agent routing info.
+        actual_agent = None
         if not expected_agent:
             score_value = "0.0"
             rationale = "Expected agent not found in expected_outcome"
-        elif not actual_agent:
-            score_value = "0.0"
-            rationale = "Agent information missing from response"
-        elif actual_agent == expected_agent:
-            score_value = "1.0"
-            rationale = f"✓ Correct agent selected: {actual_agent}"
         else:
-            score_value = "0.0"
-            rationale = f"✗ Wrong agent: expected {expected_agent}, got {actual_agent}"
+            # Get actual outcome from message_piece.converted_value (API response)
+            converted_value = message_piece.converted_value
+            response_text = converted_value if isinstance(converted_value, str) else str(converted_value)
+
+            # Try to extract agent from response (format: "AgentUsed': 'agent_name")
+            key_idx = response_text.find(_AGENT_USED_KEY)
+            agent_match = _AGENT_USED_RE.match(response_text, key_idx) if key_idx != -1 else None
+            actual_agent = agent_match.group(1) if agent_match else None
+
+            if not actual_agent:
+                score_value = "0.0"
+                rationale = "Agent information missing from response"
+            elif actual_agent == expected_agent:
+                score_value = "1.0"
+                rationale = f"✓ Correct agent selected: {actual_agent}"
+            else:
+                score_value = "0.0"
+                rationale = f"✗ Wrong agent: expected {expected_agent}, got {actual_agent}"
         
         return [Score(
             score_value=score_value,
@@ -1,17 +1,24 @@
 """Unity Catalog integration for storing evaluation results."""
 
+import atexit
+import logging
 import os
 import json
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Optional
 from pathlib import Path
 
 from databricks import sql
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.errors import DatabricksError
 from databricks.sdk.service.catalog import VolumeType
 
 from eval.models import EvaluationResults, QuestionResult
 
+logger = logging.getLogger(__name__)
+
 
 class UnityCatalogWriter:
     """Write evaluation results to Unity Catalog."""
@@ -28,6 +35,20 @@ class UnityCatalogWriter:
         self.http_path = os.getenv("DATABRICKS_HTTP_PATH")
         self.access_token = os.getenv("DATABRICKS_TOKEN")
         
+        # Credentials come from the environment once at construction, so
+        # connectability is fixed for the writer's lifetime
+        self._connectable = bool(self.server_hostname and self.http_path and self.access_token)
+
+        # Lazily-created SQL connection shared across DDL and inserts, so a
+        # write_results call doesn't pay 4+ TLS/Thrift session setups.
+        # DBSQL connections are not safe for interleaved use, and several
+        # worker threads can call write_results concurrently - the RLock
+        # serializes both connection creation and every use of it
+        self._connection = None
+        self._conn_lock = threading.RLock()
+        # DDL (schema/table/volume) only needs to run once per writer lifetime
+        self._infra_ready = False
+
         # Initialize Databricks SDK client
         self.workspace_client = None
         if self.access_token and self.server_hostname:
@@ -37,36 +58,66 @@ class UnityCatalogWriter:
                     token=self.access_token
                 )
             except Exception as e:
-                print(f"Warning: Could not initialize Databricks workspace client: {e}")
+                logger.warning("Could not initialize Databricks workspace client: %s", e)
     
+    def _conn(self):
+        """Get the shared SQL connection, creating it on first use.
+
+        Callers must hold _conn_lock for as long as they use the returned
+        connection (the lock is reentrant, so wrapping the whole block is
+        fine).
+        """
+        with self._conn_lock:
+            if self._connection is None:
+                self._connection = sql.connect(
+                    server_hostname=self.server_hostname,
+                    http_path=self.http_path,
+                    access_token=self.access_token
+                )
+            return self._connection
+
+    def close(self):
+        """Close the shared SQL connection, if open."""
+        with self._conn_lock:
+            if self._connection is not None:
+                try:
+                    self._connection.close()
+                except Exception:
+                    pass
+                self._connection = None
+
+    def _invalidate_connection(self):
+        """Drop the cached connection so the next write reconnects.
+
+        Called on write failures: a stale or server-side-closed session
+        would otherwise fail every later write for the process lifetime.
+        """
+        self.close()
+
     def _ensure_schema_exists(self):
         """Ensure the catalog and schema exist."""
         if not self._can_connect():
-            print("Skipping schema creation - no connection")
+            logger.info("Skipping schema creation - no connection")
             return
-        
+
         try:
             # Try to create schema - will succeed if it doesn't exist, or fail gracefully if it does
             create_schema_sql = f"""
             CREATE SCHEMA IF NOT EXISTS {self.catalog}.{self.schema}
             COMMENT 'SNA Evaluation Framework results'
             """
-            
-            with sql.connect(
-                server_hostname=self.server_hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
-            ) as connection:
-                with connection.cursor() as cursor:
+
+            with self._conn_lock:
+                with self._conn().cursor() as cursor:
                     cursor.execute(create_schema_sql)
-                    print(f"Schema {self.catalog}.{self.schema} ready")
+            logger.info("Schema %s.%s ready", self.catalog, self.schema)
         except Exception as e:
-            print(f"Note: Schema may already exist or insufficient permissions: {e}")
+            logger.info("Schema may already exist or insufficient permissions: %s", e)
     
     def _ensure_table_exists(self):
         """Ensure the results table exists."""
         if not self._can_connect():
-            print("Skipping table creation - no connection")
+            logger.info("Skipping table creation - no connection")
             return
         
         create_table_sql = f"""
@@ -102,21 +153,17 @@ class UnityCatalogWriter:
         """
         
         try:
-            with sql.connect(
-                server_hostname=self.server_hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
-            ) as connection:
-                with connection.cursor() as cursor:
+            with self._conn_lock:
+                with self._conn().cursor() as cursor:
                     cursor.execute(create_table_sql)
-                    print(f"Table {self.catalog}.{self.schema}.{self.table} ready")
+            logger.info("Table %s.%s.%s ready", self.catalog, self.schema, self.table)
         except Exception as e:
-            print(f"Warning: Could not ensure table exists: {e}")
+            logger.warning("Could not ensure table exists: %s", e)
     
     def _ensure_volume_exists(self):
         """Ensure the volume for storing reports exists."""
         if not self._can_connect():
-            print("Skipping volume creation - no connection")
+            logger.info("Skipping volume creation - no connection")
             return
         
         try:
@@ -126,43 +173,40 @@ class UnityCatalogWriter:
             COMMENT 'SNA Evaluation Framework - Evaluation reports (JSON and HTML)'
             """
             
-            with sql.connect(
-                server_hostname=self.server_hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
-            ) as connection:
-                with connection.cursor() as cursor:
+            with self._conn_lock:
+                with self._conn().cursor() as cursor:
                     cursor.execute(create_volume_sql)
-                    print(f"Volume {self.catalog}.{self.schema}.{self.volume} ready")
+            logger.info("Volume %s.%s.%s ready", self.catalog, self.schema, self.volume)
         except Exception as e:
-            print(f"Note: Volume may already exist or insufficient permissions: {e}")
+            logger.info("Volume may already exist or insufficient permissions: %s", e)
     
     def _can_connect(self) -> bool:
         """Check if we can connect to Unity Catalog."""
-        return bool(self.server_hostname and self.http_path and self.access_token)
+        return self._connectable
     
-    def _upload_report_to_volume(self, local_path: str, report_type: str, job_id: str) -> Optional[str]:
-        """Upload report file to Unity Catalog volume."""
+    def _upload_report_to_volume(self, local_path: str, report_type: str, job_id: str, day: str) -> Optional[str]:
+        """Upload report file to Unity Catalog volume.
+
+        Args:
+            day: UTC date partition (YYYYMMDD), computed once per write_results
+        """
         if not self.workspace_client or not local_path or not os.path.exists(local_path):
             return None
-        
+
         try:
             # Volume path format: /Volumes/{catalog}/{schema}/{volume}/{path}
-            timestamp = datetime.utcnow().strftime("%Y%m%d")
-            filename = f"{job_id}_{report_type}.{report_type}"
-            volume_path = f"/Volumes/{self.catalog}/{self.schema}/{self.volume}/{timestamp}/{filename}"
+            filename = f"{job_id}.{report_type}"
+            volume_path = f"/Volumes/{self.catalog}/{self.schema}/{self.volume}/{day}/{filename}"
             
-            # Read local file
+            # Stream the file to the volume; the SDK accepts a binary file
+            # object, so large HTML reports never sit fully in memory
             with open(local_path, 'rb') as f:
-                content = f.read()
-            
-            # Upload to volume
-            self.workspace_client.files.upload(volume_path, content, overwrite=True)
-            print(f"Uploaded {report_type} report to {volume_path}")
+                self.workspace_client.files.upload(volume_path, f, overwrite=True)
+            logger.info("Uploaded %s report to %s", report_type, volume_path)
             
             return volume_path
-        except Exception as e:
-            print(f"Warning: Could not upload {report_type} report: {e}")
+        except (OSError, DatabricksError) as e:
+            logger.warning("Could not upload %s report: %s", report_type, e)
             return local_path  # Return local path as fallback
     
     def write_results(self, results: EvaluationResults) -> bool:
@@ -175,35 +219,51 @@ class UnityCatalogWriter:
         Returns:
             True if successful, False otherwise
         """
-        # Ensure infrastructure exists
-        self._ensure_schema_exists()
-        self._ensure_volume_exists()
-        self._ensure_table_exists()
-        
+        # Ensure infrastructure exists (once per writer lifetime)
+        if not self._infra_ready:
+            self._ensure_schema_exists()
+            self._ensure_volume_exists()
+            self._ensure_table_exists()
+            self._infra_ready = True
+
         if not self._can_connect():
-            print("Warning: Unity Catalog credentials not configured")
-            print("Set DATABRICKS_SERVER_HOSTNAME, DATABRICKS_HTTP_PATH, and DATABRICKS_TOKEN")
-            print("Skipping Unity Catalog write")
+            logger.warning(
+                "Unity Catalog credentials not configured - set DATABRICKS_SERVER_HOSTNAME, "
+                "DATABRICKS_HTTP_PATH, and DATABRICKS_TOKEN. Skipping Unity Catalog write"
+            )
             return False
         
         try:
-            # Upload report files to volume
+            # Upload report files to volume; date partition computed once.
+            # The two uploads are independent network calls, so run them
+            # concurrently instead of back to back
+            day = datetime.now(timezone.utc).strftime("%Y%m%d")
             json_path = None
             html_path = None
-            
-            if results.report_json_path:
-                json_path = self._upload_report_to_volume(
-                    results.report_json_path, 
-                    "json", 
-                    results.job_id
-                )
-            
-            if results.report_html_path:
-                html_path = self._upload_report_to_volume(
-                    results.report_html_path,
-                    "html",
-                    results.job_id
-                )
+
+            json_future = None
+            html_future = None
+            with ThreadPoolExecutor(max_workers=2) as upload_pool:
+                if results.report_json_path:
+                    json_future = upload_pool.submit(
+                        self._upload_report_to_volume,
+                        results.report_json_path,
+                        "json",
+                        results.job_id,
+                        day
+                    )
+                if results.report_html_path:
+                    html_future = upload_pool.submit(
+                        self._upload_report_to_volume,
+                        results.report_html_path,
+                        "html",
+                        results.job_id,
+                        day
+                    )
+                if json_future:
+                    json_path = json_future.result()
+                if html_future:
+                    html_path = html_future.result()
             
             # Write results to table (one row per question per scorer)
             insert_sql = f"""
@@ -217,53 +277,62 @@ class UnityCatalogWriter:
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
             
-            with sql.connect(
-                server_hostname=self.server_hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
-            ) as connection:
+            # One row per question per scorer, shipped as a single
+            # parameterized batch instead of a round-trip per row. The
+            # job-level and question-level columns repeat across rows, so
+            # build them as tuples once per level instead of re-reading
+            # nine Pydantic attributes per scorer row
+            job_fields = (
+                results.job_id,
+                results.submitted_at,
+                results.started_at,
+                results.completed_at,
+                results.status.value,
+                results.target_url,
+                results.total_questions,
+                results.questions_completed,
+                results.overall_score,
+            )
+            tail_fields = (json_path, html_path, results.error_message)
+
+            rows = []
+            for question_result in results.question_results:
+                expected = question_result.expected_outcome
+                question_fields = job_fields + (
+                    question_result.question,
+                    expected.response,
+                    expected.agent,
+                    expected.reason,
+                    question_result.actual_response,
+                    question_result.actual_agent,
+                    question_result.actual_routing_reason,
+                )
+                for scorer_result in question_result.scorer_results:
+                    rows.append(question_fields + (
+                        scorer_result.scorer_name,
+                        scorer_result.score,
+                        scorer_result.weight,
+                        scorer_result.weighted_score,
+                        scorer_result.rationale,
+                    ) + tail_fields)
+
+            with self._conn_lock:
+                connection = self._conn()
                 with connection.cursor() as cursor:
-                    # Insert one row per question per scorer
-                    for question_result in results.question_results:
-                        for scorer_result in question_result.scorer_results:
-                            cursor.execute(insert_sql, (
-                                results.job_id,
-                                results.submitted_at,
-                                results.started_at,
-                                results.completed_at,
-                                results.status.value,
-                                results.target_url,
-                                results.total_questions,
-                                results.questions_completed,
-                                results.overall_score,
-                                question_result.question,
-                                question_result.expected_outcome.response,
-                                question_result.expected_outcome.agent,
-                                question_result.expected_outcome.reason,
-                                question_result.actual_response,
-                                question_result.actual_agent,
-                                question_result.actual_routing_reason,
-                                scorer_result.scorer_name,
-                                scorer_result.score,
-                                scorer_result.weight,
-                                scorer_result.weighted_score,
-                                scorer_result.rationale,
-                                json_path,
-                                html_path,
-                                results.error_message
-                            ))
-                    
+                    if rows:
+                        cursor.executemany(insert_sql, rows)
                     connection.commit()
-            
-            print(f"✓ Results written to Unity Catalog: {self.catalog}.{self.schema}.{self.table}")
+
+            logger.info("Results written to Unity Catalog: %s.%s.%s", self.catalog, self.schema, self.table)
             return True
         
-        except Exception as e:
-            print(f"Error writing to Unity Catalog: {e}")
-            import traceback
-            traceback.print_exc()
+        except (OSError, DatabricksError, sql.Error):
+            logger.exception("Unity Catalog write failed")
+            # The session may be stale or half-closed; reconnect next time
+            self._invalidate_connection()
             return False
 
 
 # Global instance
 unity_catalog_writer = UnityCatalogWriter()
+atexit.register(unity_catalog_writer.close)
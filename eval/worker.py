@@ -1,22 +1,72 @@
 """Background worker for processing evaluation jobs."""
 
+import atexit
+import itertools
+import logging
 import os
 import yaml
 import json
+import shutil
 import subprocess
 import tempfile
-import threading
+
+try:
+    # libyaml C emitter: dataset files materialize in milliseconds instead
+    # of going through PyYAML's pure-Python emitter
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    import ijson  # streams large report files without materializing them
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # 2-5x faster JSON encode/decode; optional
+except ImportError:
+    orjson = None
+
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from eval.models import (
-    JobStatus, EvaluationRequest, EvaluationResults, 
-    QuestionResult, ScorerResult, ExpectedOutcome
+    JobStatus, EvaluationRequest, EvaluationResults,
+    Question, QuestionResult, ScorerResult, ExpectedOutcome
 )
-from eval.job_queue import job_queue
+from eval.job_queue import job_queue, Job
 from eval.unity_catalog import unity_catalog_writer
 
+logger = logging.getLogger(__name__)
+
+
+def _json_dumps_indented(obj: Any) -> str:
+    """JSON-encode with 2-space indentation, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# PyRIT runner entrypoint, imported once per process so repeated jobs skip
+# the interpreter + pyrit import startup a subprocess pays every time.
+# Resolved lazily because the import pulls in the whole pyrit stack.
+_pyrit_cli_main = None
+_pyrit_cli_checked = False
+
+
+def _get_pyrit_cli_main():
+    """Import the PyRIT runner CLI entrypoint once; None if unavailable."""
+    global _pyrit_cli_main, _pyrit_cli_checked
+    if not _pyrit_cli_checked:
+        _pyrit_cli_checked = True
+        try:
+            from pyrit_eval_runner.cli import main as cli_main
+            _pyrit_cli_main = cli_main
+        except ImportError:
+            _pyrit_cli_main = None
+    return _pyrit_cli_main
+
 
 class EvaluationWorker:
     """Background worker for running PyRIT evaluations."""
@@ -72,6 +122,14 @@ class EvaluationWorker:
             ]
         }
         
+        # Static derivations of the scorer config, computed once instead of
+        # per job / per question
+        self._all_scorers = [self.scorer_config["main"]] + self.scorer_config["auxiliary"]
+        self._scorer_display_names = [
+            Path(cfg["path"]).stem.replace("_scorer", "") for cfg in self._all_scorers
+        ]
+        self._scorer_config_json = json.dumps(self.scorer_config)
+
         # Azure OpenAI configuration
         self.openai_endpoint = os.getenv(
             "OPENAI_CHAT_ENDPOINT",
@@ -87,66 +145,153 @@ class EvaluationWorker:
             if not job:
                 return
             
-            request: EvaluationRequest = job["request"]
+            request: EvaluationRequest = job.request
             
             # Update status to running
             job_queue.update_status(job_id, JobStatus.RUNNING)
-            
-            # Create temporary YAML dataset from request
-            dataset_path = self._create_dataset_yaml(request)
-            
-            try:
-                # Run PyRIT evaluation
-                output_json, output_html = self._run_pyrit_evaluation(
-                    dataset_path=dataset_path,
-                    target_url=request.target_url,
-                    job_id=job_id
-                )
-                
-                # Parse results
-                results = self._parse_results(
-                    job_id=job_id,
-                    request=request,
-                    output_json=output_json,
-                    output_html=output_html,
-                    job_data=job
-                )
-                
-                # Store results in job queue
-                job_queue.set_results(job_id, results)
-                job_queue.update_status(job_id, JobStatus.COMPLETED)
-                
-                # Write to Unity Catalog if enabled
-                if os.getenv("UNITY_CATALOG_ENABLED", "false").lower() == "true":
-                    try:
-                        unity_catalog_writer.write_results(results)
-                        print(f"Results written to Unity Catalog for job {job_id}")
-                    except Exception as e:
-                        print(f"Warning: Failed to write to Unity Catalog: {e}")
-                else:
-                    print(f"Unity Catalog disabled - results saved locally only")
-                
-            finally:
-                # Cleanup temporary dataset file
-                if dataset_path and os.path.exists(dataset_path):
-                    os.remove(dataset_path)
-        
+
+            # Run PyRIT evaluation (sharded across concurrent runner
+            # invocations when EVAL_CONCURRENCY > 1)
+            output_json, output_html = self._run_sharded_evaluation(request, job_id)
+
+            # Parse results
+            results = self._parse_results(
+                job_id=job_id,
+                request=request,
+                output_json=output_json,
+                output_html=output_html,
+                job_data=job
+            )
+
+            # Store results in job queue
+            job_queue.set_results(job_id, results)
+            job_queue.update_status(job_id, JobStatus.COMPLETED)
+
+            # Write to Unity Catalog if enabled
+            if os.getenv("UNITY_CATALOG_ENABLED", "false").lower() == "true":
+                try:
+                    unity_catalog_writer.write_results(results)
+                    logger.info("Results written to Unity Catalog for job %s", job_id)
+                except Exception as e:
+                    logger.warning("Failed to write to Unity Catalog: %s", e)
+            else:
+                logger.info("Unity Catalog disabled - results saved locally only")
+
         except Exception as e:
             error_msg = f"Evaluation failed: {str(e)}"
             job_queue.set_error(job_id, error_msg)
-            print(f"Error processing job {job_id}: {error_msg}")
+            logger.error("Error processing job %s: %s", job_id, error_msg)
     
-    def _create_dataset_yaml(self, request: EvaluationRequest) -> str:
-        """Convert JSON request to YAML dataset file."""
+    def _run_sharded_evaluation(
+        self,
+        request: EvaluationRequest,
+        job_id: str
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Run the evaluation, sharding questions across concurrent runs.
+
+        Evaluation is I/O-bound (HTTP to the target and to the scoring
+        model), so splitting the dataset into EVAL_CONCURRENCY shards and
+        running them in parallel collapses wall time toward the slowest
+        shard. The runner call blocks, so shards run on threads.
+        """
+        concurrency = max(1, int(os.getenv("EVAL_CONCURRENCY", "1")))
+        num_shards = min(concurrency, len(request.questions))
+
+        if num_shards <= 1:
+            dataset_path = self._create_dataset_yaml(request.questions)
+            try:
+                return self._run_pyrit_evaluation(dataset_path, request.target_url, job_id)
+            finally:
+                if os.path.exists(dataset_path):
+                    os.remove(dataset_path)
+
+        shards: List[List[Question]] = [request.questions[i::num_shards] for i in range(num_shards)]
+        dataset_paths = [self._create_dataset_yaml(shard) for shard in shards]
+        try:
+            with ThreadPoolExecutor(max_workers=num_shards) as pool:
+                futures = [
+                    pool.submit(
+                        self._run_pyrit_evaluation,
+                        path,
+                        request.target_url,
+                        f"{job_id}/shard_{i}"
+                    )
+                    for i, path in enumerate(dataset_paths)
+                ]
+                outputs = [future.result() for future in futures]
+        finally:
+            for path in dataset_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+        return self._merge_shard_reports(job_id, outputs, num_shards, len(request.questions))
+
+    def _merge_shard_reports(
+        self,
+        job_id: str,
+        outputs: List[tuple],
+        num_shards: int,
+        total_questions: int
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Merge per-shard reports into one job-level report pair.
+
+        Shard i holds questions[i::num_shards], so its k-th report entry
+        belongs at position i + k * num_shards of the original dataset.
+        Re-interleaving here means _parse_results pairs every entry with
+        the question it actually answered, and the stored/uploaded report
+        covers the whole job rather than a single shard's slice.
+        """
+        output_dir = self.base_dir / "pyrit_reports" / job_id
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Positions a shard produced no entry for stay None, preserving the
+        # alignment of everything that did arrive
+        merged_entries: List[Any] = [None] * total_questions
+        have_json = False
+        for shard_idx, (json_path, _) in enumerate(outputs):
+            if not json_path or not os.path.exists(json_path):
+                continue
+            have_json = True
+            positions = range(shard_idx, total_questions, num_shards)
+            for pos, entry in zip(positions, self._iter_report_entries(json_path)):
+                merged_entries[pos] = entry
+
+        output_json = None
+        if have_json:
+            output_json = str(output_dir / "report.json")
+            with open(output_json, 'w') as f:
+                f.write(_json_dumps_indented(merged_entries))
+
+        # The HTML reports are standalone documents with no sensible deep
+        # merge; concatenating them with a shard marker keeps one
+        # uploadable file per job instead of N loose shard files
+        html_sources = [
+            (shard_idx, html_path)
+            for shard_idx, (_, html_path) in enumerate(outputs)
+            if html_path and os.path.exists(html_path)
+        ]
+        output_html = None
+        if html_sources:
+            output_html = str(output_dir / "report.html")
+            with open(output_html, 'w') as out:
+                for shard_idx, html_path in html_sources:
+                    out.write(f"<!-- shard {shard_idx} -->\n")
+                    with open(html_path, 'r') as f:
+                        shutil.copyfileobj(f, out)
+
+        return output_json, output_html
+
+    def _create_dataset_yaml(self, questions: List[Question]) -> str:
+        """Convert questions to a YAML dataset file."""
         # Convert to PyRIT dataset format
         dataset = []
-        for q in request.questions:
+        for q in questions:
             # expected_outcome as JSON string (matching hydrated format)
-            expected_json = json.dumps({
+            expected_json = _json_dumps_indented({
                 "response": q.expected_outcome.response,
                 "agent": q.expected_outcome.agent,
                 "reason": q.expected_outcome.reason
-            }, indent=2)
+            })
             
             dataset.append({
                 "question": q.question,
@@ -160,7 +305,7 @@ class EvaluationWorker:
             delete=False,
             dir=self.base_dir / "eval"
         ) as f:
-            yaml.dump(dataset, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(dataset, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
             return f.name
     
     def _run_pyrit_evaluation(
@@ -169,24 +314,20 @@ class EvaluationWorker:
         target_url: str,
         job_id: str
     ) -> tuple[str, str]:
-        """Run PyRIT evaluation CLI command."""
-        # Build scorer JSON with proper format
-        scorer_json = json.dumps(self.scorer_config)
-        
+        """Run PyRIT evaluation, in-process when the runner is importable."""
+        # Scorer JSON is static; serialized once in __init__
+        scorer_json = self._scorer_config_json
+
         # Create output directory for reports
         output_dir = self.base_dir / "pyrit_reports" / job_id
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Build command (based on run_evaluation.sh)
-        venv_python = self.base_dir / ".venv-eval" / "bin" / "python"
-        
+
         # Get auth token for commerce agents (if needed)
         # Commerce agents doesn't require auth token currently
         auth_token = os.getenv("COMMERCE_AGENTS_AUTH_TOKEN", "not-used")
-        
-        cmd = [
-            str(venv_python),
-            "-m", "pyrit_eval_runner.cli",
+
+        # Runner arguments (based on run_evaluation.sh)
+        runner_args = [
             "run",
             "--config", str(self.config_path),
             "--dataset-path", dataset_path,
@@ -199,66 +340,112 @@ class EvaluationWorker:
             "--openai-chat-model", "gpt-5",
             "--scorer-temperature", "1.0"
         ]
+
+        # Prefer the in-process entrypoint: no interpreter fork and no
+        # re-import of the pyrit stack per job. PYRIT_SUBPROCESS forces the
+        # old subprocess path (e.g. to isolate against runner crashes).
+        cli_main = None if os.getenv("PYRIT_SUBPROCESS") else _get_pyrit_cli_main()
+
+        if cli_main is not None:
+            logger.info("Running PyRIT evaluation in-process for job %s...", job_id)
+            # CLI entrypoints routinely sys.exit() - even with code 0 on
+            # success - and SystemExit is not an Exception, so letting it
+            # escape would bypass process_job's error handling entirely
+            try:
+                returncode = cli_main(runner_args)
+            except SystemExit as e:
+                returncode = e.code
+            if returncode not in (None, 0):
+                raise RuntimeError(f"PyRIT evaluation failed with exit code {returncode}")
+        else:
+            # Fall back to the dedicated evaluation venv
+            venv_python = self.base_dir / ".venv-eval" / "bin" / "python"
+            cmd = [str(venv_python), "-m", "pyrit_eval_runner.cli"] + runner_args
+
+            logger.info("Running PyRIT evaluation for job %s...", job_id)
+            logger.info("Command: %s", " ".join(cmd))
+
+            # Stream runner output line by line instead of buffering the
+            # whole stdout/stderr in memory - PyRIT's progress logs can run
+            # to tens of MB, and streaming also gives live visibility into
+            # long-running jobs
+            proc = subprocess.Popen(
+                cmd,
+                cwd=str(self.base_dir),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
+            )
+            for line in proc.stdout:
+                logger.info("pyrit[%s]: %s", job_id, line.rstrip())
+            returncode = proc.wait()
+
+            if returncode != 0:
+                raise RuntimeError(f"PyRIT evaluation failed with exit code {returncode}")
         
-        print(f"Running PyRIT evaluation for job {job_id}...")
-        print(f"Command: {' '.join(cmd)}")
-        
-        # Run command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(self.base_dir)
-        )
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"PyRIT evaluation failed: {result.stderr}")
-        
-        print(f"PyRIT output:\n{result.stdout}")
-        
-        # Look for output files in the output directory
-        output_json = None
-        output_html = None
-        
-        # PyRIT creates files in the output directory
-        json_files = list(output_dir.glob("*.json"))
-        html_files = list(output_dir.glob("*.html"))
-        
-        if json_files:
-            output_json = str(json_files[0])
-        if html_files:
-            output_html = str(html_files[0])
-        
+        # Look for output files in the output directory. One scandir pass
+        # bucketed by extension instead of two separate globs - matters on
+        # slow network filesystems
+        json_files: List[str] = []
+        html_files: List[str] = []
+        for entry in os.scandir(output_dir):
+            if entry.is_file():
+                if entry.name.endswith(".json"):
+                    json_files.append(entry.path)
+                elif entry.name.endswith(".html"):
+                    html_files.append(entry.path)
+
+        output_json = json_files[0] if json_files else None
+        output_html = html_files[0] if html_files else None
+
         return output_json, output_html
     
+    def _iter_report_entries(self, output_json: str):
+        """Yield per-question entries from the PyRIT report one at a time.
+
+        Streams via ijson when available so memory stays flat on large
+        reports; falls back to a full json.load otherwise. The report's
+        top level is a list of per-question entries.
+        """
+        if ijson is not None:
+            with open(output_json, 'rb') as f:
+                yield from ijson.items(f, 'item')
+        elif orjson is not None:
+            with open(output_json, 'rb') as f:
+                yield from orjson.loads(f.read())
+        else:
+            with open(output_json, 'r') as f:
+                yield from json.load(f)
+
     def _parse_results(
         self,
         job_id: str,
         request: EvaluationRequest,
         output_json: str,
         output_html: str,
-        job_data: Dict[str, Any]
+        job_data: Job
     ) -> EvaluationResults:
         """Parse PyRIT results into structured format."""
         question_results = []
         overall_score = 0.0
-        
+
         # If we have JSON output, parse it
         if output_json and os.path.exists(output_json):
-            with open(output_json, 'r') as f:
-                pyrit_results = json.load(f)
-            
-            # Parse each question's results
+            report_entries = self._iter_report_entries(output_json)
+
+            # Parse each question's results, consuming the report one entry
+            # at a time so large runs never hold the whole file in memory.
             # Note: PyRIT output format may vary, this is a simplified parser
-            for idx, q in enumerate(request.questions):
+            for q, pyrit_entry in itertools.zip_longest(request.questions, report_entries):
+                if q is None:
+                    break
                 scorer_results = []
                 question_score = 0.0
                 
                 # Extract scorer results for this question
                 # Use scorer config to get names and weights
-                all_scorers = [self.scorer_config["main"]] + self.scorer_config["auxiliary"]
-                for scorer_cfg in all_scorers:
-                    scorer_name = Path(scorer_cfg["path"]).stem.replace("_scorer", "")
+                for scorer_cfg, scorer_name in zip(self._all_scorers, self._scorer_display_names):
                     weight = scorer_cfg["weight"]
                     
                     # Placeholder: actual parsing depends on PyRIT format
@@ -293,8 +480,8 @@ class EvaluationWorker:
         return EvaluationResults(
             job_id=job_id,
             status=JobStatus.COMPLETED,
-            submitted_at=job_data["submitted_at"],
-            started_at=job_data["started_at"],
+            submitted_at=job_data.submitted_at,
+            started_at=job_data.started_at,
             completed_at=datetime.utcnow(),
             target_url=request.target_url,
             total_questions=len(request.questions),
@@ -318,9 +505,30 @@ def _get_worker():
     return _worker
 
 
+# Bounded pool shared by all jobs: threads are reused across jobs instead
+# of created per submission, and a burst of submissions queues here rather
+# than spawning an unbounded number of concurrent evaluations
+_POOL = ThreadPoolExecutor(
+    max_workers=max(1, int(os.getenv("EVAL_MAX_WORKERS", "4"))),
+    thread_name_prefix="eval-worker"
+)
+atexit.register(_POOL.shutdown, wait=False, cancel_futures=True)
+
+
 def start_evaluation_async(job_id: str) -> None:
-    """Start evaluation in background thread."""
+    """Queue the evaluation on the shared worker pool."""
     worker = _get_worker()
-    thread = threading.Thread(target=worker.process_job, args=(job_id,))
-    thread.daemon = True
-    thread.start()
+
+    def _log_if_dead(future) -> None:
+        # process_job catches Exception, so anything landing here is a
+        # BaseException (or a bug in the handler itself) that would
+        # otherwise vanish with the discarded future and leave the job
+        # RUNNING forever
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Worker for job %s died unexpectedly: %r", job_id, exc, exc_info=exc)
+            job_queue.set_error(job_id, f"Evaluation failed: {exc}")
+
+    _POOL.submit(worker.process_job, job_id).add_done_callback(_log_if_dead)
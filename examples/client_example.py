@@ -1,181 +1,669 @@
 """Example client for the SNA Evaluation Framework API."""
 
-import requests
+import asyncio
+import gzip
+import json
+import random
+import ssl
+import sys
 import time
-from typing import Dict, Any, List
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+try:
+    import orjson  # 3-10x faster JSON decode, 2-4x faster encode; optional
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # libuv event loop, ~2-4x faster callback dispatch; optional
+except ImportError:
+    uvloop = None
+
+try:
+    import ijson  # incremental JSON parsing for large result reports; optional
+except ImportError:
+    ijson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """JSON-encode to bytes via orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON via orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Question batches at least this large are submitted with chunked transfer
+# encoding instead of one in-memory bytes blob
+_STREAM_THRESHOLD = 500
+
+# Encoded request bodies at least this large are gzip-compressed before
+# sending; repetitive question JSON shrinks 5-10x
+_COMPRESS_MIN_BYTES = 16 * 1024
+
+
+# Top-level result fields returned by get_results_summary
+_SUMMARY_FIELDS = frozenset({
+    "overall_score", "questions_completed", "total_questions",
+    "report_json_path", "report_html_path",
+})
+
+_OUTCOME_KEYS = ("response", "agent", "reason")
+
+
+def validate_questions(questions: List[Dict[str, Any]]) -> None:
+    """
+    Check question shape locally before submitting.
+
+    A malformed batch otherwise costs a full round-trip just to get the
+    server's 422 back. Raises ValueError naming the first bad entry.
+    """
+    if not questions:
+        raise ValueError("questions must not be empty")
+    for i, q in enumerate(questions):
+        if not isinstance(q.get("question"), str):
+            raise ValueError(f"questions[{i}].question must be a string")
+        outcome = q.get("expected_outcome")
+        if not isinstance(outcome, dict):
+            raise ValueError(f"questions[{i}].expected_outcome must be a dict")
+        for key in _OUTCOME_KEYS:
+            if not isinstance(outcome.get(key), str):
+                raise ValueError(f"questions[{i}].expected_outcome.{key} must be a string")
+
+
+def questions_to_columns(questions: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """
+    Transpose row-form questions into the columnar wire format.
+
+    The server accepts `questions` as a struct-of-arrays dict, so the four
+    repeated key names are encoded once instead of once per question -
+    roughly 50 bytes saved per question before compression.
+    """
+    return {
+        "question": [q["question"] for q in questions],
+        "response": [q["expected_outcome"]["response"] for q in questions],
+        "agent": [q["expected_outcome"]["agent"] for q in questions],
+        "reason": [q["expected_outcome"]["reason"] for q in questions],
+    }
 
 
 class EvaluationClient:
-    """Client for interacting with the evaluation API."""
-    
+    """Async client for interacting with the evaluation API.
+
+    All HTTP calls share a single aiohttp.ClientSession, so concurrent
+    submissions and polls multiplex over one keep-alive connection pool
+    instead of blocking an OS thread per request. Use as an async context
+    manager:
+
+        async with EvaluationClient() as client:
+            await client.health_check()
+    """
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
-    
-    def health_check(self) -> Dict[str, Any]:
-        """Check API health status."""
-        response = requests.get(f"{self.base_url}/health")
-        response.raise_for_status()
-        return response.json()
-    
-    def list_scorers(self) -> List[Dict[str, Any]]:
-        """Get list of available scorers."""
-        response = requests.get(f"{self.base_url}/scorers")
-        response.raise_for_status()
-        return response.json()
-    
-    def submit_evaluation(
+        self._session: Optional[aiohttp.ClientSession] = None
+        # path -> (fetched_at, json) for the stale-while-revalidate cache
+        self._cache: Dict[str, tuple] = {}
+        # path -> in-flight background refresh. The loop holds only weak
+        # task references, so without this a refresh could be
+        # garbage-collected mid-flight; it also caps refreshes at one per
+        # path
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        # job_id -> (etag, last status dict) for conditional status polls
+        self._etags: Dict[str, tuple] = {}
+        # job_id -> formatted status path; polling loops hit this per poll,
+        # so the f-string runs once per job instead of once per request
+        self._status_paths: Dict[str, str] = {}
+        self._warmup: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "EvaluationClient":
+        # HTTP/1.1 keep-alive pool. HTTP/2 multiplexing (e.g. via
+        # httpx[http2]) would collapse this to one socket, but the API is
+        # served by uvicorn over HTTP/1.1, so a pooled connector is the
+        # practical equivalent here.
+        connector_kwargs: Dict[str, Any] = {"limit": 64, "keepalive_timeout": 75}
+        if self.base_url.startswith("https://"):
+            # Session tickets: when the pool does open a new connection, a
+            # resumed session skips a full handshake round-trip. Both TLS
+            # 1.2 and 1.3 support ticket resumption, so the default
+            # protocol floor stays - forcing 1.3 would hard-fail against
+            # endpoints that only negotiate 1.2. (0-RTT early data is not
+            # exposed by CPython's ssl module, so resumption is as far as
+            # this can go.)
+            ssl_ctx = ssl.create_default_context()
+            ssl_ctx.options &= ~ssl.OP_NO_TICKET
+            connector_kwargs["ssl"] = ssl_ctx
+        self._session = aiohttp.ClientSession(
+            base_url=self.base_url,
+            connector=aiohttp.TCPConnector(**connector_kwargs)
+        )
+        # Pre-warm: fire a health check without awaiting it, so the DNS +
+        # TCP (+ TLS) handshake overlaps with whatever the caller does
+        # next (typically building the questions payload). It also primes
+        # the /health SWR cache.
+        self._warmup = asyncio.create_task(self.health_check())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._warmup is not None and not self._warmup.done():
+            self._warmup.cancel()
+        if self._warmup is not None:
+            try:
+                await self._warmup
+            except (asyncio.CancelledError, aiohttp.ClientError):
+                pass
+            self._warmup = None
+        # Background SWR refreshes must not outlive the session
+        pending = [task for task in self._refresh_tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        for task in pending:
+            try:
+                await task
+            except (asyncio.CancelledError, aiohttp.ClientError):
+                pass
+        await self._session.close()
+        self._session = None
+
+    async def _refresh(self, path: str) -> Any:
+        """Fetch `path` and store the response in the SWR cache."""
+        async with self._session.get(path) as response:
+            response.raise_for_status()
+            data = _json_loads(await response.read())
+        self._cache[path] = (time.monotonic(), data)
+        return data
+
+    async def _get_swr(self, path: str, ttl: float, stale: float) -> Any:
+        """
+        GET with a stale-while-revalidate cache.
+
+        A fresh cache hit (age < ttl) returns instantly with no network
+        traffic. A stale hit (age < ttl + stale) also returns instantly but
+        kicks off a background refresh. Only a cold or expired entry blocks
+        on the network.
+        """
+        cached = self._cache.get(path)
+        if cached:
+            fetched_at, data = cached
+            age = time.monotonic() - fetched_at
+            if age < ttl:
+                return data
+            if age < ttl + stale:
+                if path not in self._refresh_tasks:
+                    task = asyncio.create_task(self._refresh(path))
+                    self._refresh_tasks[path] = task
+                    task.add_done_callback(lambda t, path=path: self._refresh_done(path, t))
+                return data
+        return await self._refresh(path)
+
+    def _refresh_done(self, path: str, task: "asyncio.Task") -> None:
+        """Release a finished background refresh.
+
+        Retrieving the exception here keeps a failed refresh from emitting
+        "Task exception was never retrieved"; on a network error the stale
+        entry simply keeps being served until the next attempt.
+        """
+        self._refresh_tasks.pop(path, None)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None and not isinstance(exc, aiohttp.ClientError):
+            raise exc
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check API health status (cached for 5s, served stale up to 30s)."""
+        return await self._get_swr("/health", ttl=5, stale=30)
+
+    async def list_scorers(self) -> List[Dict[str, Any]]:
+        """Get list of available scorers (cached for 120s, served stale up to 600s)."""
+        return await self._get_swr("/scorers", ttl=120, stale=600)
+
+    async def submit_evaluation(
         self,
         target_url: str,
         questions: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """
         Submit a batch evaluation request.
-        
+
         Args:
             target_url: URL of the target endpoint to evaluate
             questions: List of questions with expected outcomes
                 Each question should have:
                 - question: str
                 - expected_outcome: dict with response, agent, reason
-        
+
         Returns:
             Response with job_id for polling
         """
+        validate_questions(questions)
+
+        if len(questions) >= _STREAM_THRESHOLD:
+            return await self._submit_streaming(target_url, questions)
+
+        payload = {
+            "target_url": target_url,
+            "questions": questions_to_columns(questions)
+        }
+
+        body = _json_dumps(payload)
+        headers = {"Content-Type": "application/json"}
+        if len(body) >= _COMPRESS_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=3)
+            headers["Content-Encoding"] = "gzip"
+
+        async with self._session.post(
+            "/evaluate",
+            data=body,
+            headers=headers
+        ) as response:
+            response.raise_for_status()
+            return _json_loads(await response.read())
+
+    async def _submit_streaming(
+        self,
+        target_url: str,
+        questions: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Submit via chunked upload, encoding one question at a time.
+
+        The async generator hands aiohttp one encoded question per chunk,
+        so peak memory is one question instead of the whole payload, and
+        the first bytes hit the socket before the last question is even
+        encoded. The wire format is still plain JSON.
+        """
+        async def _gen():
+            yield b'{"target_url":' + _json_dumps(target_url) + b',"questions":['
+            for i, question in enumerate(questions):
+                if i:
+                    yield b","
+                yield _json_dumps(question)
+            yield b"]}"
+
+        async with self._session.post(
+            "/evaluate",
+            data=_gen(),
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            response.raise_for_status()
+            return _json_loads(await response.read())
+
+    async def submit_many(
+        self,
+        jobs: List[tuple],
+        concurrency: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit several evaluations concurrently.
+
+        All POSTs are issued at once (bounded by a semaphore), so the total
+        wall time is roughly the slowest round-trip instead of the sum.
+
+        Args:
+            jobs: List of (target_url, questions) pairs
+            concurrency: Maximum number of in-flight submissions
+
+        Returns:
+            Submission responses, in the same order as `jobs`
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(target_url: str, questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+            async with sem:
+                return await self.submit_evaluation(target_url, questions)
+
+        return await asyncio.gather(*[_one(url, qs) for url, qs in jobs])
+
+    async def get_status(self, job_id: str, wait: int = 0) -> Dict[str, Any]:
+        """
+        Get evaluation job status.
+
+        Args:
+            job_id: Job ID to query
+            wait: Long-poll hold time in seconds (0 = return immediately).
+                The server blocks until status or progress changes, or the
+                hold time elapses.
+        """
+        path = self._status_paths.get(job_id)
+        if path is None:
+            path = self._status_paths[job_id] = f"/evaluate/{job_id}"
+        params = {"wait": wait} if wait else None
+        timeout = aiohttp.ClientTimeout(total=wait + 5) if wait else None
+        cached = self._etags.get(job_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        async with self._session.get(
+            path, params=params, timeout=timeout, headers=headers
+        ) as response:
+            # 304: nothing changed since the last poll - reuse the cached
+            # status without transferring or decoding a body
+            if response.status == 304 and cached:
+                return cached[1]
+            response.raise_for_status()
+            status = _json_loads(await response.read())
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etags[job_id] = (etag, status)
+            return status
+
+    async def get_status_many(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the status of several jobs in one round-trip.
+
+        Returns {job_id: status}; unknown IDs map to None. Polling M jobs
+        through this costs one GET instead of M.
+        """
+        async with self._session.get(
+            "/evaluate", params={"ids": ",".join(job_ids)}
+        ) as response:
+            response.raise_for_status()
+            return _json_loads(await response.read())
+
+    async def get_results(self, job_id: str) -> Dict[str, Any]:
+        """Get detailed evaluation results (only when completed)."""
+        async with self._session.get(f"/evaluate/{job_id}/results") as response:
+            response.raise_for_status()
+            return _json_loads(await response.read())
+
+    async def get_results_summary(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get just the top-level result fields, without the per-question detail.
+
+        When ijson is available the response is parsed incrementally and the
+        per-question scorer arrays are never materialized as Python objects,
+        so peak memory stays flat however large the report is. Falls back to
+        a full decode plus projection otherwise.
+        """
+        async with self._session.get(f"/evaluate/{job_id}/results") as response:
+            response.raise_for_status()
+            if ijson is None:
+                results = _json_loads(await response.read())
+                return {key: results.get(key) for key in _SUMMARY_FIELDS}
+            summary: Dict[str, Any] = {}
+            async for prefix, event, value in ijson.parse_async(response.content):
+                if prefix in _SUMMARY_FIELDS and event in ("string", "number", "null"):
+                    summary[prefix] = value
+            return summary
+
+    async def stream_progress(self, job_id: str):
+        """
+        Yield status events pushed by the server over Server-Sent Events.
+
+        One connection lives for the whole job; the server pushes an event
+        on every status or progress change, so there is no polling loop at
+        all. The stream ends when the job reaches a terminal state.
+        """
+        async with self._session.get(
+            f"/evaluate/{job_id}/events",
+            headers={"Accept": "text/event-stream"},
+            timeout=aiohttp.ClientTimeout(total=None)
+        ) as response:
+            response.raise_for_status()
+            async for raw in response.content:
+                if raw.startswith(b"data:"):
+                    yield _json_loads(raw[5:])
+
+    async def _follow_until_done(self, job_id: str, poll_interval: int) -> Dict[str, Any]:
+        """Consume the job's SSE stream until a terminal event arrives."""
+        failures = 0
+        last_percent = -1
+        while True:
+            try:
+                async for event in self.stream_progress(job_id):
+                    failures = 0
+                    if event["status"] in ["completed", "failed"]:
+                        if last_percent >= 0:
+                            sys.stdout.write("\n")
+                        return event
+                    if event["status"] == "running" and event.get("progress"):
+                        progress = event["progress"]
+                        # Rewrite one line, and only when the percentage
+                        # actually moved - no stdout syscall per heartbeat
+                        if progress["percent"] != last_percent:
+                            last_percent = progress["percent"]
+                            sys.stdout.write(
+                                f"\rProgress: {progress['percent']}% "
+                                f"({progress['questions_completed']}/{progress['questions_total']} questions)"
+                            )
+                            sys.stdout.flush()
+            except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError) as e:
+                if isinstance(e, aiohttp.ClientResponseError) and e.status < 500:
+                    raise
+                failures += 1
+                backoff = min(poll_interval * 2 ** (failures - 1), 60)
+                await asyncio.sleep(backoff + random.uniform(0, 2))
+
+    async def wait_for_completion(
+        self,
+        job_id: str,
+        poll_interval: int = 5,
+        max_wait: int = 600
+    ) -> Dict[str, Any]:
+        """
+        Consume the job's SSE stream until completion, with a hard deadline.
+
+        The server pushes every status change over one held connection, so
+        there is no client-side polling. Dropped streams reconnect with
+        exponential backoff plus jitter, so many clients reconnecting after
+        a server restart don't stampede in lockstep. The whole operation
+        runs under asyncio.wait_for, so the deadline cancels even an
+        in-flight request and closes its socket.
+
+        Args:
+            job_id: Job ID to follow
+            poll_interval: Base backoff delay after a dropped stream
+            max_wait: Maximum seconds to wait
+
+        Returns:
+            Final job status event
+        """
+        try:
+            return await asyncio.wait_for(
+                self._follow_until_done(job_id, poll_interval), timeout=max_wait
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Job {job_id} did not complete within {max_wait} seconds"
+            ) from None
+
+
+class SyncEvaluationClient:
+    """Synchronous client variant for callers not running an event loop.
+
+    Unlike bare requests.get/post (which pays DNS + TCP + TLS per call),
+    all requests go through one requests.Session with a pooled
+    HTTPAdapter, so every polling GET reuses the same connection. Retries
+    with backoff are handled by the adapter for transient 5xx responses.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000"):
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        self.base_url = base_url
+        self._request_error = requests.RequestException
+        # job_id -> formatted status URL, built once per job (polled per loop)
+        self._status_urls: Dict[str, str] = {}
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def health_check(self) -> Dict[str, Any]:
+        """Check API health status."""
+        response = self._session.get(f"{self.base_url}/health")
+        response.raise_for_status()
+        return response.json()
+
+    def list_scorers(self) -> List[Dict[str, Any]]:
+        """Get list of available scorers."""
+        response = self._session.get(f"{self.base_url}/scorers")
+        response.raise_for_status()
+        return response.json()
+
+    def submit_evaluation(
+        self,
+        target_url: str,
+        questions: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Submit a batch evaluation request."""
         payload = {
             "target_url": target_url,
             "questions": questions
         }
-        
-        response = requests.post(f"{self.base_url}/evaluate", json=payload)
+        response = self._session.post(f"{self.base_url}/evaluate", json=payload)
         response.raise_for_status()
         return response.json()
-    
-    def get_status(self, job_id: str) -> Dict[str, Any]:
-        """Get evaluation job status."""
-        response = requests.get(f"{self.base_url}/evaluate/{job_id}")
+
+    def get_status(self, job_id: str, wait: int = 0) -> Dict[str, Any]:
+        """Get evaluation job status, optionally long-polling for `wait` seconds."""
+        url = self._status_urls.get(job_id)
+        if url is None:
+            url = self._status_urls[job_id] = f"{self.base_url}/evaluate/{job_id}"
+        params = {"wait": wait} if wait else None
+        response = self._session.get(
+            url, params=params, timeout=wait + 5 if wait else None
+        )
         response.raise_for_status()
         return response.json()
-    
+
     def get_results(self, job_id: str) -> Dict[str, Any]:
         """Get detailed evaluation results (only when completed)."""
-        response = requests.get(f"{self.base_url}/evaluate/{job_id}/results")
+        response = self._session.get(f"{self.base_url}/evaluate/{job_id}/results")
         response.raise_for_status()
         return response.json()
-    
+
     def wait_for_completion(
-        self, 
-        job_id: str, 
+        self,
+        job_id: str,
         poll_interval: int = 5,
         max_wait: int = 600
     ) -> Dict[str, Any]:
         """
-        Poll job status until completion.
-        
+        Long-poll job status until completion.
+
+        Failed polls back off exponentially (capped at 60s) with uniform
+        jitter, so N clients reconnecting after a server restart spread out
+        instead of retrying on the same beat.
+
         Args:
             job_id: Job ID to poll
-            poll_interval: Seconds between polls
+            poll_interval: Base backoff delay after a failed poll
             max_wait: Maximum seconds to wait
-        
-        Returns:
-            Final job status
         """
-        elapsed = 0
-        while elapsed < max_wait:
-            status = self.get_status(job_id)
-            
+        deadline = time.monotonic() + max_wait
+        failures = 0
+        while time.monotonic() < deadline:
+            try:
+                status = self.get_status(job_id, wait=30)
+            except self._request_error:
+                failures += 1
+                backoff = min(poll_interval * 2 ** (failures - 1), 60)
+                time.sleep(backoff + random.uniform(0, 2))
+                continue
+            failures = 0
             if status["status"] in ["completed", "failed"]:
                 return status
-            
-            if status["status"] == "running" and "progress" in status:
-                progress = status["progress"]
-                print(f"Progress: {progress['percent']}% "
-                      f"({progress['questions_completed']}/{progress['questions_total']} questions)")
-            
-            time.sleep(poll_interval)
-            elapsed += poll_interval
-        
         raise TimeoutError(f"Job {job_id} did not complete within {max_wait} seconds")
 
 
 # Example usage
-if __name__ == "__main__":
-    client = EvaluationClient()
-    
-    # Health check
-    print("=" * 60)
-    print("Health check:")
-    print(client.health_check())
-    print()
-    
-    # List scorers
-    print("=" * 60)
-    print("Available scorers:")
-    scorers = client.list_scorers()
-    for scorer in scorers:
-        print(f"  - {scorer['name']}: {scorer['weight']} - {scorer['description']}")
-    print()
-    
-    # Submit batch evaluation
-    print("=" * 60)
-    print("Submitting batch evaluation...")
-    
-    questions = [
-        {
-            "question": "What were total sales in Q3 2024?",
-            "expected_outcome": {
-                "response": "Total sales in Q3 2024 were €4,459,017,155.65.",
-                "agent": "merchandising_descriptives",
-                "reason": "Simple aggregation query for sales metrics"
-            }
-        },
-        {
-            "question": "Which product category had the highest growth in Q2?",
-            "expected_outcome": {
-                "response": "Fresh Produce had the highest growth at 12.5% in Q2.",
-                "agent": "merchandising_descriptives",
-                "reason": "Comparative analysis across product categories"
-            }
-        },
-        {
-            "question": "What is the average basket size for this month?",
-            "expected_outcome": {
-                "response": "The average basket size for November 2024 is €28.45.",
-                "agent": "merchandising_descriptives",
-                "reason": "Simple metric calculation for current period"
+async def main() -> None:
+    async with EvaluationClient() as client:
+        # Health check
+        print("=" * 60)
+        print("Health check:")
+        print(await client.health_check())
+        print()
+
+        # List scorers
+        print("=" * 60)
+        print("Available scorers:")
+        scorers = await client.list_scorers()
+        for scorer in scorers:
+            print(f"  - {scorer['name']}: {scorer['weight']} - {scorer['description']}")
+        print()
+
+        # Submit batch evaluation
+        print("=" * 60)
+        print("Submitting batch evaluation...")
+
+        questions = [
+            {
+                "question": "What were total sales in Q3 2024?",
+                "expected_outcome": {
+                    "response": "Total sales in Q3 2024 were €4,459,017,155.65.",
+                    "agent": "merchandising_descriptives",
+                    "reason": "Simple aggregation query for sales metrics"
+                }
+            },
+            {
+                "question": "Which product category had the highest growth in Q2?",
+                "expected_outcome": {
+                    "response": "Fresh Produce had the highest growth at 12.5% in Q2.",
+                    "agent": "merchandising_descriptives",
+                    "reason": "Comparative analysis across product categories"
+                }
+            },
+            {
+                "question": "What is the average basket size for this month?",
+                "expected_outcome": {
+                    "response": "The average basket size for November 2024 is €28.45.",
+                    "agent": "merchandising_descriptives",
+                    "reason": "Simple metric calculation for current period"
+                }
             }
-        }
-    ]
-    
-    result = client.submit_evaluation(
-        target_url="http://localhost:6000/chat",
-        questions=questions
-    )
-    
-    job_id = result["job_id"]
-    print(f"Job submitted: {job_id}")
-    print(f"Status: {result['status']}")
-    print(f"Total questions: {result['total_questions']}")
-    print()
-    
-    # Poll for completion
-    print("=" * 60)
-    print("Waiting for evaluation to complete...")
-    try:
-        final_status = client.wait_for_completion(job_id)
-        print(f"\nJob completed with status: {final_status['status']}")
-        
-        if final_status["status"] == "completed":
-            # Get detailed results
-            results = client.get_results(job_id)
-            print(f"\nOverall Score: {results['overall_score']:.2f}")
-            print(f"Questions Evaluated: {results['questions_completed']}/{results['total_questions']}")
-            
-            if results.get("report_json_path"):
-                print(f"JSON Report: {results['report_json_path']}")
-            if results.get("report_html_path"):
-                print(f"HTML Report: {results['report_html_path']}")
-    
-    except TimeoutError as e:
-        print(f"Error: {e}")
-    except requests.HTTPError as e:
-        print(f"API Error: {e}")
+        ]
+
+        result = await client.submit_evaluation(
+            target_url="http://localhost:6000/chat",
+            questions=questions
+        )
+
+        job_id = result["job_id"]
+        print(f"Job submitted: {job_id}")
+        print(f"Status: {result['status']}")
+        print(f"Total questions: {result['total_questions']}")
+        print()
+
+        # Poll for completion
+        print("=" * 60)
+        print("Waiting for evaluation to complete...")
+        try:
+            final_status = await client.wait_for_completion(job_id)
+            print(f"\nJob completed with status: {final_status['status']}")
+
+            if final_status["status"] == "completed":
+                # Only the top-level fields are needed here, so skip
+                # decoding the per-question detail
+                results = await client.get_results_summary(job_id)
+                print(f"\nOverall Score: {results['overall_score']:.2f}")
+                print(f"Questions Evaluated: {results['questions_completed']}/{results['total_questions']}")
+
+                if results.get("report_json_path"):
+                    print(f"JSON Report: {results['report_json_path']}")
+                if results.get("report_html_path"):
+                    print(f"HTML Report: {results['report_html_path']}")
+
+        except TimeoutError as e:
+            print(f"Error: {e}")
+        except aiohttp.ClientResponseError as e:
+            print(f"API Error: {e}")
+
+
+if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())